@@ -1,13 +1,28 @@
+if __name__ == "__main__":
+    # gunicorn's gevent worker patches the standard library itself; do the
+    # same when the module is run directly, before anything imports socket.
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import gzip
+import hashlib
 import logging
+import queue
 import sys
-from datetime import datetime, timedelta, timezone
-from functools import wraps
+import threading
+import time
+from array import array
+from datetime import datetime
+from functools import lru_cache, wraps
 
 try:
     # For Docker environment
     from config import Config
     from docker_service import DockerService
     from logging_utils import (
+        RateLimitedLogger,
+        emit,
         log_request,
         set_request_id,
         setup_logging,
@@ -17,6 +32,8 @@ except ImportError:
     from backend.config import Config
     from backend.docker_service import DockerService
     from backend.logging_utils import (
+        RateLimitedLogger,
+        emit,
         log_request,
         set_request_id,
         setup_logging,
@@ -24,36 +41,102 @@ except ImportError:
 
 import re
 
-import eventlet
-from flask import Flask, Response, jsonify, request
+import docker
+import orjson
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
 from flask_socketio import SocketIO
-from werkzeug.exceptions import HTTPException
+from werkzeug.exceptions import HTTPException, NotFound
 
 # Configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
+# Routine WebSocket connect logs, capped per event so reconnect storms do not
+# flood the log pipeline
+connect_logger = RateLimitedLogger(logger)
+
+# Length of the rate limiting window in seconds
+RATE_LIMIT_WINDOW = 60
+_EMPTY_BUCKETS = array("i", [0] * RATE_LIMIT_WINDOW)
+
+# Maximum number of log lines sent in a single log_update_batch event
+LOG_BATCH_MAX_LINES = 32
+
+# Seconds to keep collecting lines for a batch after the first one arrives
+LOG_BATCH_MAX_DELAY = 0.05
+
+# Lines read from Docker but not yet emitted. When a client falls behind, the
+# reader blocks instead of buffering an unbounded backlog in memory.
+LOG_QUEUE_MAX_LINES = 1024
+
+# Seconds a container or image listing is served from cache before Docker is
+# queried again. The frontend polls every REFRESH_INTERVAL seconds, and
+# actions that change containers or images clear the cache right away.
+LISTING_CACHE_TTL = Config.REFRESH_INTERVAL / 2
+
+# Cached listings at least this many bytes long also keep a gzipped copy
+LISTING_GZIP_MIN_SIZE = 1024
+
+# Response body of the root health check endpoint, which never changes
+_INDEX_BODY = orjson.dumps(
+    {"status": "success", "data": {"status": "Docker Web Interface API is running"}}
+)
+
+# Response body for the default 404, the most common error response
+_NOT_FOUND_BODY = orjson.dumps({"status": "error", "error": NotFound.description})
+
+# Valid container and image identifiers (IDs, ID prefixes or names); anything
+# else is rejected before a Docker API round-trip
+_CONTAINER_ID_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.-]{0,127}$")
+_IMAGE_ID_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.:@-]{0,255}$")
+
+# Query string values accepted as true for boolean flags
+_TRUTHY = frozenset({"1", "true", "True", "TRUE", "yes", "on"})
+
+# Logger extras that do not depend on the request, built once at import
+_EXTRA_FETCH_IMAGES = {"event": "fetch_images", "path": "/api/images"}
+_EXTRA_FETCH_IMAGES_NO_DATA = {
+    "event": "fetch_images_error",
+    "error": "Failed to fetch image data",
+}
+_EXTRA_PRUNE_CONTAINERS = {
+    "event": "prune_containers",
+    "path": "/api/docker/prune/containers",
+}
+_EXTRA_PRUNE_IMAGES = {"event": "prune_images", "path": "/api/docker/prune/images"}
+_EXTRA_PRUNE_VOLUMES = {
+    "event": "prune_volumes",
+    "path": "/api/docker/prune/volumes",
+}
+_EXTRA_PRUNE_NETWORKS = {
+    "event": "prune_networks",
+    "path": "/api/docker/prune/networks",
+}
+_EXTRA_PRUNE_ALL = {"event": "prune_all", "path": "/api/docker/prune/all"}
+
+
+class _OrjsonPacketJson:
+    """json-module stand-in that lets Socket.IO encode packets with orjson.
+
+    python-socketio only calls dumps(obj, separators=...) and loads(s); orjson
+    output is already compact, so extra arguments are ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
 
 
 class FlaskApp:
     """Flask application for Docker monitoring."""
 
-    _instance = None
-    _routes_registered = False
-
-    def __new__(cls, *args, **kwargs):
-        """Ensure only one instance of FlaskApp is created (Singleton pattern)."""
-        if cls._instance is None:
-            cls._instance = super(FlaskApp, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-
     def __init__(self, socketio=None):
         """Initialize the Flask application."""
-        # Only initialize once
-        if self._initialized:
-            return
-        self._initialized = True
+        self._routes_registered = False
 
         # Create Flask app
         self.app = Flask(__name__)
@@ -67,9 +150,17 @@ class FlaskApp:
             self.socketio = SocketIO(
                 self.app,
                 cors_allowed_origins="*",  # Use wildcard string to allow all origins
-                async_mode="eventlet",
+                async_mode="gevent",
+                # No Flask session handling or per-packet logging is needed
+                manage_session=False,
+                logger=False,
+                engineio_logger=False,
+                # Clients only send small control messages
+                max_http_buffer_size=1 << 20,
+                # Encode packets such as initial_state with orjson
+                json=_OrjsonPacketJson,
             )
-            logging.info("Server initialized for eventlet.")
+            logging.info("Server initialized for gevent.")
         else:
             self.socketio = socketio
 
@@ -78,54 +169,226 @@ class FlaskApp:
         self.docker_service.start_event_subscription()
         logging.info("Docker events subscription initialized")
 
+        # Map container actions to their Docker service methods
+        self._action_map = {
+            "start": self.docker_service.start_container,
+            "stop": self.docker_service.stop_container,
+            "restart": self.docker_service.restart_container,
+            "rebuild": self.docker_service.rebuild_container,
+            "delete": self.docker_service.delete_container,
+        }
+
         # Set up routes and socket handlers
         self.setup_routes()
         self.setup_socket_handlers()
 
-        # Set up rate limiting
-        self.request_counts = {}
-        self.last_cleanup = datetime.now(timezone.utc)
+        # Set up rate limiting (ring of per-second counters covering the last
+        # 60 seconds of the monotonic clock, plus their running sum)
+        self._second_buckets = array("i", _EMPTY_BUCKETS)
+        self._last_second = int(time.monotonic())
+        self._window_count = 0
         self.current_rate_limit = Config.MAX_REQUESTS_PER_MINUTE
 
         # Track active log streams
         self.active_streams = {}
 
+        # Serialized listings: key -> (time, body, etag, gzip_body)
+        self._listing_cache = {}
+        # Raw Container objects shared by the listing and connect paths
+        self._containers_cache = None
+        self._containers_lock = threading.Lock()
+        # initial_state payload for the snapshot above: (containers, states)
+        self._container_states_cache = None
+        # Docker events keep the container snapshot current between polls
+        self.docker_service.add_container_event_listener(
+            self._on_container_event
+        )
+
     def error_response(self, message, status_code=400):
         """Return an error response."""
-        response = jsonify({"status": "error", "error": message})
-        response.status_code = status_code
-        return response
+        return Response(
+            orjson.dumps({"status": "error", "error": message}),
+            status=status_code,
+            mimetype="application/json",
+        )
+
+    def success_body(self, data):
+        """Serialize a success payload.
+
+        Serialized with orjson, which handles datetimes natively.
+        """
+        return orjson.dumps(
+            {"status": "success", "data": data}, option=orjson.OPT_NAIVE_UTC
+        )
 
     def success_response(self, data):
         """Return a success response."""
-        return jsonify({"status": "success", "data": data})
+        return Response(self.success_body(data), mimetype="application/json")
+
+    def etag_response(self, body, etag, gzip_body=None):
+        """Return a JSON response with an ETag, or 304 if the client has it.
+
+        When a gzipped copy of the body is available and the client accepts
+        gzip, that copy is sent instead under its own ETag.
+        """
+        if gzip_body is not None and "gzip" in request.accept_encodings:
+            response = Response(gzip_body, mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+            response.set_etag(f"{etag}-gzip")
+        else:
+            response = Response(body, mimetype="application/json")
+            response.set_etag(etag)
+        if gzip_body is not None:
+            response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
+
+    def cached_listing(self, key, load):
+        """Return (body, etag, gzip_body, error) for a listing, reusing recent ones.
+
+        load() returns (data, error). Successful results are serialized (and
+        gzipped when large) once and served for LISTING_CACHE_TTL seconds
+        without asking Docker again.
+        """
+        now = time.monotonic()
+        cached = self._listing_cache.get(key)
+        if cached is not None and now - cached[0] < LISTING_CACHE_TTL:
+            return cached[1], cached[2], cached[3], None
+
+        data, error = load()
+        if error:
+            return None, None, None, error
+
+        body = self.success_body(data)
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        gzip_body = None
+        if len(body) >= LISTING_GZIP_MIN_SIZE:
+            gzip_body = gzip.compress(body, compresslevel=6, mtime=0)
+        self._listing_cache[key] = (now, body, etag, gzip_body)
+        return body, etag, gzip_body, None
+
+    def invalidate_listings(self):
+        """Drop cached listings after an action that changes containers or images."""
+        self._listing_cache.clear()
+        self._containers_cache = None
+
+    def _on_container_event(self, container_id, state):
+        """Drop the cached container snapshot when Docker reports a change."""
+        self._listing_cache.pop("containers", None)
+        self._containers_cache = None
+
+    def _fetch_containers(self):
+        """Return (containers, error), reusing a listing fetched moments ago.
+
+        A page load hits both /api/containers and the socket connect handler;
+        sharing the Container objects means Docker is only asked once.
+        """
+        cached = self._containers_cache
+        if cached is not None and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+            return cached[1], None
+
+        # Only one caller refreshes; clients connecting at the same time wait
+        # for it and reuse its result instead of each querying Docker
+        with self._containers_lock:
+            now = time.monotonic()
+            cached = self._containers_cache
+            if cached is not None and now - cached[0] < LISTING_CACHE_TTL:
+                return cached[1], None
+
+            containers, error = self.docker_service.get_all_containers()
+            if error:
+                return None, error
+            self._containers_cache = (now, containers)
+            return containers, None
+
+    def _container_states(self, containers):
+        """Return the initial_state payload for a container snapshot.
+
+        The payload is built once per snapshot and reused by every client
+        that connects while the snapshot is current.
+        """
+        cached = self._container_states_cache
+        if cached is not None and cached[0] is containers:
+            return cached[1]
+
+        container_states = [
+            {
+                "container_id": container.id,
+                "name": container.name,
+                "image": container.image,
+                "status": container.status,
+                "state": container.state,
+                "ports": container.ports,
+                "compose_project": container.compose_project,
+                "compose_service": container.compose_service,
+                "created": container.created_iso,
+            }
+            for container in containers
+        ]
+        self._container_states_cache = (containers, container_states)
+        return container_states
+
+    def _load_containers(self):
+        """Fetch and format all containers for the listing endpoint."""
+        containers, error = self._fetch_containers()
+        if error:
+            return None, error
+        return self.docker_service.format_container_data(containers), None
+
+    def _load_images(self):
+        """Fetch and format all images for the listing endpoint."""
+        images, error = self.docker_service.get_all_images()
+
+        if error:
+            emit(
+                logger,
+                logging.ERROR,
+                "fetch_images_error",
+                "Error fetching images",
+                error=error,
+            )
+            return None, error
+
+        if images is None:
+            logger.error(
+                "No image data returned",
+                extra=_EXTRA_FETCH_IMAGES_NO_DATA,
+            )
+            return None, "Failed to fetch image data"
+
+        response_data = self.docker_service.format_image_data(images)
+        emit(
+            logger,
+            logging.INFO,
+            "fetch_images_success",
+            "Successfully fetched images",
+            image_count=len(response_data),
+        )
+        return response_data, None
 
     def setup_routes(self):
         """Set up the Flask routes."""
         # Only register routes once
         if self._routes_registered:
             return
-        self.__class__._routes_registered = True
+        self._routes_registered = True
 
         @self.app.route("/", endpoint="index")
         @log_request()
         def index():
             """Root endpoint."""
-            return self.success_response(
-                {"status": "Docker Web Interface API is running"}
-            )
+            return Response(_INDEX_BODY, mimetype="application/json")
 
         @self.app.route("/api/containers", endpoint="list_containers")
         @self.rate_limit
         @log_request()
         def list_containers() -> Response:
             """List all containers."""
-            containers, error = self.docker_service.get_all_containers()
+            body, etag, gzip_body, error = self.cached_listing(
+                "containers", self._load_containers
+            )
             if error:
                 return self.error_response(error)
-            return self.success_response(
-                self.docker_service.format_container_data(containers)
-            )
+            return self.etag_response(body, etag, gzip_body)
 
         @self.app.route(
             "/api/containers/<container_id>/logs", endpoint="get_container_logs"
@@ -133,69 +396,87 @@ class FlaskApp:
         @self.rate_limit
         @log_request()
         def get_container_logs(container_id: str) -> Response:
-            """Get logs for a specific container."""
+            """Get logs for a specific container.
+
+            With ?stream=1 the complete log is streamed as plain text instead
+            of being buffered into a single JSON response.
+            """
+            if not _CONTAINER_ID_RE.match(container_id):
+                return self.error_response("Invalid container id", 400)
+
+            if request.args.get("stream") == "1":
+                # The stream is only read once the response has started, so
+                # resolve the container first to fail with a real status
+                try:
+                    self.docker_service.client.containers.get(container_id)
+                except docker.errors.NotFound:
+                    return self.error_response(
+                        f"Container {container_id} not found", 404
+                    )
+                except docker.errors.APIError as e:
+                    return self.error_response(
+                        f"Failed to get container logs: {str(e)}", 500
+                    )
+                return Response(
+                    stream_with_context(
+                        self.docker_service.stream_container_logs(
+                            container_id, follow=False, tail="all"
+                        )
+                    ),
+                    mimetype="text/plain",
+                )
+
             logs, error = self.docker_service.get_container_logs(container_id)
             if error:
                 return self.error_response(error)
             return self.success_response({"logs": logs})
 
+        # Unknown actions fail URL matching with a 404 before any handler runs
+        action_rule = f"<any({', '.join(self._action_map)}):action>"
+
         @self.app.route(
-            "/api/containers/<container_id>/<action>",
+            f"/api/containers/<container_id>/{action_rule}",
             methods=["POST"],
             endpoint="container_action",
         )
         @self.rate_limit
         @log_request()
         def container_action(container_id: str, action: str) -> Response:
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "container_action",
                 "Received container action request",
-                extra={
-                    "event": "container_action",
-                    "container_id": container_id,
-                    "action": action,
-                },
+                container_id=container_id,
+                action=action,
             )
 
-            if action not in ["start", "stop", "restart", "rebuild", "delete"]:
-                logger.warning(
-                    "Invalid container action requested",
-                    extra={
-                        "event": "container_action_error",
-                        "container_id": container_id,
-                        "action": action,
-                        "error": "Invalid action",
-                    },
-                )
-                return self.error_response(f"Invalid action: {action}", 400)
-
-            action_map = {
-                "start": self.docker_service.start_container,
-                "stop": self.docker_service.stop_container,
-                "restart": self.docker_service.restart_container,
-                "rebuild": self.docker_service.rebuild_container,
-                "delete": self.docker_service.delete_container,
-            }
+            if not _CONTAINER_ID_RE.match(container_id):
+                return self.error_response("Invalid container id", 400)
 
-            success, error = action_map[action](container_id)
+            success, error = self._action_map[action](container_id)
+            self.invalidate_listings()
             if not success:
-                logger.error(
-                    f"Failed to {action} container",
-                    extra={
-                        "event": "container_action_error",
-                        "container_id": container_id,
-                        "action": action,
-                        "error": error,
-                    },
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "container_action_error",
+                    "Failed to %s container",
+                    action,
+                    container_id=container_id,
+                    action=action,
+                    error=error,
                 )
                 return self.error_response(error or f"Failed to {action} container")
 
-            logger.info(
-                f"Successfully {action}ed container",
-                extra={
-                    "event": "container_action_success",
-                    "container_id": container_id,
-                    "action": action,
-                },
+            emit(
+                logger,
+                logging.INFO,
+                "container_action_success",
+                "Successfully %sed container",
+                action,
+                container_id=container_id,
+                action=action,
             )
             return self.success_response(
                 {"message": f"Container {action}d successfully"}
@@ -210,42 +491,14 @@ class FlaskApp:
             """Get all Docker images."""
             logger.info(
                 "Received request to fetch all Docker images",
-                extra={
-                    "event": "fetch_images",
-                    "path": "/api/images",
-                },
+                extra=_EXTRA_FETCH_IMAGES,
+            )
+            body, etag, gzip_body, error = self.cached_listing(
+                "images", self._load_images
             )
-            images, error = self.docker_service.get_all_images()
-
             if error:
-                logger.error(
-                    "Error fetching images",
-                    extra={
-                        "event": "fetch_images_error",
-                        "error": error,
-                    },
-                )
                 return self.error_response(error)
-
-            if images is None:
-                logger.error(
-                    "No image data returned",
-                    extra={
-                        "event": "fetch_images_error",
-                        "error": "Failed to fetch image data",
-                    },
-                )
-                return self.error_response("Failed to fetch image data")
-
-            response_data = self.docker_service.format_image_data(images)
-            logger.info(
-                "Successfully fetched images",
-                extra={
-                    "event": "fetch_images_success",
-                    "image_count": len(response_data),
-                },
-            )
-            return self.success_response(response_data)
+            return self.etag_response(body, etag, gzip_body)
 
         @self.app.route(
             "/api/images/<image_id>", methods=["DELETE"], endpoint="delete_image"
@@ -254,36 +507,40 @@ class FlaskApp:
         @log_request()
         def delete_image(image_id: str) -> Response:
             """Delete a Docker image."""
-            force = request.args.get("force", "false").lower() == "true"
-            logger.info(
+            if not _IMAGE_ID_RE.match(image_id):
+                return self.error_response("Invalid image id", 400)
+
+            force = request.args.get("force", "") in _TRUTHY
+            emit(
+                logger,
+                logging.INFO,
+                "delete_image",
                 "Received request to delete image",
-                extra={
-                    "event": "delete_image",
-                    "image_id": image_id,
-                    "force": force,
-                },
+                image_id=image_id,
+                force=force,
             )
 
             success, error = self.docker_service.delete_image(image_id, force=force)
+            self.invalidate_listings()
             if not success:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "delete_image_error",
                     "Failed to delete image",
-                    extra={
-                        "event": "delete_image_error",
-                        "image_id": image_id,
-                        "force": force,
-                        "error": error,
-                    },
+                    image_id=image_id,
+                    force=force,
+                    error=error,
                 )
                 return self.error_response(error or "Failed to delete image")
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "delete_image_success",
                 "Successfully deleted image",
-                extra={
-                    "event": "delete_image_success",
-                    "image_id": image_id,
-                    "force": force,
-                },
+                image_id=image_id,
+                force=force,
             )
             return self.success_response({"message": "Image deleted successfully"})
 
@@ -298,31 +555,29 @@ class FlaskApp:
             """Prune all stopped containers."""
             logger.info(
                 "Received request to prune all stopped containers",
-                extra={
-                    "event": "prune_containers",
-                    "path": "/api/docker/prune/containers",
-                },
+                extra=_EXTRA_PRUNE_CONTAINERS,
             )
 
             success, result, error = self.docker_service.prune_containers()
+            self.invalidate_listings()
 
             if not success or error:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "prune_containers_error",
                     "Failed to prune containers",
-                    extra={
-                        "event": "prune_containers_error",
-                        "error": error,
-                    },
+                    error=error,
                 )
                 return self.error_response(error or "Failed to prune containers")
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "prune_containers_success",
                 "Successfully pruned containers",
-                extra={
-                    "event": "prune_containers_success",
-                    "containers_deleted": len(result.get("containers_deleted", [])),
-                    "space_reclaimed": result.get("space_reclaimed", 0),
-                },
+                containers_deleted=len(result.get("containers_deleted", [])),
+                space_reclaimed=result.get("space_reclaimed", 0),
             )
 
             return self.success_response(
@@ -345,31 +600,29 @@ class FlaskApp:
             """Prune all dangling images."""
             logger.info(
                 "Received request to prune all dangling images",
-                extra={
-                    "event": "prune_images",
-                    "path": "/api/docker/prune/images",
-                },
+                extra=_EXTRA_PRUNE_IMAGES,
             )
 
             success, result, error = self.docker_service.prune_images()
+            self.invalidate_listings()
 
             if not success or error:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "prune_images_error",
                     "Failed to prune images",
-                    extra={
-                        "event": "prune_images_error",
-                        "error": error,
-                    },
+                    error=error,
                 )
                 return self.error_response(error or "Failed to prune images")
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "prune_images_success",
                 "Successfully pruned images",
-                extra={
-                    "event": "prune_images_success",
-                    "images_deleted": len(result.get("images_deleted", [])),
-                    "space_reclaimed": result.get("space_reclaimed", 0),
-                },
+                images_deleted=len(result.get("images_deleted", [])),
+                space_reclaimed=result.get("space_reclaimed", 0),
             )
 
             return self.success_response(
@@ -392,31 +645,28 @@ class FlaskApp:
             """Prune all unused volumes."""
             logger.info(
                 "Received request to prune all unused volumes",
-                extra={
-                    "event": "prune_volumes",
-                    "path": "/api/docker/prune/volumes",
-                },
+                extra=_EXTRA_PRUNE_VOLUMES,
             )
 
             success, result, error = self.docker_service.prune_volumes()
 
             if not success or error:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "prune_volumes_error",
                     "Failed to prune volumes",
-                    extra={
-                        "event": "prune_volumes_error",
-                        "error": error,
-                    },
+                    error=error,
                 )
                 return self.error_response(error or "Failed to prune volumes")
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "prune_volumes_success",
                 "Successfully pruned volumes",
-                extra={
-                    "event": "prune_volumes_success",
-                    "volumes_deleted": len(result.get("volumes_deleted", [])),
-                    "space_reclaimed": result.get("space_reclaimed", 0),
-                },
+                volumes_deleted=len(result.get("volumes_deleted", [])),
+                space_reclaimed=result.get("space_reclaimed", 0),
             )
 
             return self.success_response(
@@ -439,30 +689,27 @@ class FlaskApp:
             """Prune all unused networks."""
             logger.info(
                 "Received request to prune all unused networks",
-                extra={
-                    "event": "prune_networks",
-                    "path": "/api/docker/prune/networks",
-                },
+                extra=_EXTRA_PRUNE_NETWORKS,
             )
 
             success, result, error = self.docker_service.prune_networks()
 
             if not success or error:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "prune_networks_error",
                     "Failed to prune networks",
-                    extra={
-                        "event": "prune_networks_error",
-                        "error": error,
-                    },
+                    error=error,
                 )
                 return self.error_response(error or "Failed to prune networks")
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "prune_networks_success",
                 "Successfully pruned networks",
-                extra={
-                    "event": "prune_networks_success",
-                    "networks_deleted": len(result.get("networks_deleted", [])),
-                },
+                networks_deleted=len(result.get("networks_deleted", [])),
             )
 
             return self.success_response(
@@ -482,36 +729,34 @@ class FlaskApp:
             """Prune all unused Docker resources."""
             logger.info(
                 "Received request to prune all unused Docker resources",
-                extra={
-                    "event": "prune_all",
-                    "path": "/api/docker/prune/all",
-                },
+                extra=_EXTRA_PRUNE_ALL,
             )
 
             success, result, error = self.docker_service.prune_system(all_unused=True)
+            self.invalidate_listings()
 
             if not success or error:
-                logger.error(
+                emit(
+                    logger,
+                    logging.ERROR,
+                    "prune_all_error",
                     "Failed to prune all Docker resources",
-                    extra={
-                        "event": "prune_all_error",
-                        "error": error,
-                    },
+                    error=error,
                 )
                 return self.error_response(
                     error or "Failed to prune all Docker resources"
                 )
 
-            logger.info(
+            emit(
+                logger,
+                logging.INFO,
+                "prune_all_success",
                 "Successfully pruned all Docker resources",
-                extra={
-                    "event": "prune_all_success",
-                    "containers_deleted": len(result.get("containers_deleted", [])),
-                    "images_deleted": len(result.get("images_deleted", [])),
-                    "networks_deleted": len(result.get("networks_deleted", [])),
-                    "volumes_deleted": len(result.get("volumes_deleted", [])),
-                    "space_reclaimed": result.get("space_reclaimed", 0),
-                },
+                containers_deleted=len(result.get("containers_deleted", [])),
+                images_deleted=len(result.get("images_deleted", [])),
+                networks_deleted=len(result.get("networks_deleted", [])),
+                volumes_deleted=len(result.get("volumes_deleted", [])),
+                space_reclaimed=result.get("space_reclaimed", 0),
             )
 
             return self.success_response(
@@ -534,38 +779,46 @@ class FlaskApp:
             if isinstance(error, HTTPException):
                 # Log 5xx errors as ERROR, 4xx errors as WARNING, but 404s as DEBUG
                 if error.code >= 500:
-                    logger.error(
-                        f"Server error occurred: {error.description}",
-                        extra={
-                            "event": "http_error",
-                            "error": error.description,
-                            "code": error.code,
-                            "path": request.path if request else "unknown",
-                            "method": request.method if request else "unknown",
-                        },
+                    emit(
+                        logger,
+                        logging.ERROR,
+                        "http_error",
+                        "Server error occurred: %s",
+                        error.description,
+                        error=error.description,
+                        code=error.code,
+                        path=request.path if request else "unknown",
+                        method=request.method if request else "unknown",
                     )
                 elif error.code == 404:
                     # Log 404 errors at DEBUG level since they're very common
-                    logger.debug(
-                        f"Not found error: {error.description}",
-                        extra={
-                            "event": "http_not_found",
-                            "error": error.description,
-                            "code": error.code,
-                            "path": request.path if request else "unknown",
-                            "method": request.method if request else "unknown",
-                        },
+                    emit(
+                        logger,
+                        logging.DEBUG,
+                        "http_not_found",
+                        "Not found error: %s",
+                        error.description,
+                        error=error.description,
+                        code=error.code,
+                        path=request.path if request else "unknown",
+                        method=request.method if request else "unknown",
                     )
+                    # Plain 404s carry nothing request specific; reuse the body
+                    if error.description == NotFound.description:
+                        return Response(
+                            _NOT_FOUND_BODY, 404, mimetype="application/json"
+                        )
                 else:
-                    logger.warning(
-                        f"Client error occurred: {error.description}",
-                        extra={
-                            "event": "http_error",
-                            "error": error.description,
-                            "code": error.code,
-                            "path": request.path if request else "unknown",
-                            "method": request.method if request else "unknown",
-                        },
+                    emit(
+                        logger,
+                        logging.WARNING,
+                        "http_error",
+                        "Client error occurred: %s",
+                        error.description,
+                        error=error.description,
+                        code=error.code,
+                        path=request.path if request else "unknown",
+                        method=request.method if request else "unknown",
                     )
                 return self.error_response(error.description, status_code=error.code)
 
@@ -584,29 +837,32 @@ class FlaskApp:
 
         @self.socketio.on("connect")
         def handle_connect():
+            # Read request attributes once; they are used throughout the handler
+            sid = request.sid
+            client_addr = request.remote_addr
             try:
                 # Generate a unique request ID for WebSocket connections
                 request_id = request.headers.get("X-Request-ID") or set_request_id()
 
                 # Log at DEBUG level for routine connections
-                logger.debug(
+                connect_logger.debug(
                     "WebSocket client connected",
                     extra={
                         "event": "websocket_connect",
-                        "client": request.remote_addr,
-                        "sid": request.sid,
+                        "client": client_addr,
+                        "sid": sid,
                         "request_id": request_id,
                     },
                 )
 
                 # Only log at INFO level for non-routine connections (e.g., admin users)
                 if request.args.get("admin") == "true":
-                    logger.info(
+                    connect_logger.info(
                         "Admin WebSocket client connected",
                         extra={
                             "event": "admin_websocket_connect",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                             "request_id": request_id,
                         },
                     )
@@ -615,37 +871,23 @@ class FlaskApp:
                 self.socketio.emit(
                     "connection_established",
                     {"message": "WebSocket connection established"},
-                    room=request.sid,
+                    room=sid,
                 )
 
                 # Get initial container states - this will be the only batch update
                 # After this, all updates will be push-based through Docker events
-                containers, error = self.docker_service.get_all_containers()
+                containers, error = self._fetch_containers()
                 if containers and not error:
                     # Format detailed container data for initial state
-                    container_states = []
-                    for container in containers:
-                        container_states.append(
-                            {
-                                "container_id": container.id,
-                                "name": container.name,
-                                "image": container.image,
-                                "status": container.status,
-                                "state": container.state,
-                                "ports": container.ports,
-                                "compose_project": container.compose_project,
-                                "compose_service": container.compose_service,
-                                "created": container.created.isoformat(),
-                            }
-                        )
+                    container_states = self._container_states(containers)
 
                     # Send initial state in a single event - log at debug level
-                    logger.debug(
+                    connect_logger.debug(
                         "Sending initial container states",
                         extra={
                             "event": "initial_state_sending",
                             "container_count": len(container_states),
-                            "sid": request.sid,
+                            "sid": sid,
                         },
                     )
 
@@ -654,22 +896,23 @@ class FlaskApp:
                         self.socketio.emit(
                             "initial_state",
                             {"containers": container_states},
-                            room=request.sid,  # Use room consistently
+                            room=sid,  # Use room consistently
                         )
-                        logger.debug(
+                        connect_logger.debug(
                             "Sent initial container states",
                             extra={
                                 "event": "initial_state_sent",
                                 "container_count": len(container_states),
-                                "sid": request.sid,
+                                "sid": sid,
                             },
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Failed to send initial state due to socket error: {str(e)}",
+                            "Failed to send initial state due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
-                                "sid": request.sid,
+                                "sid": sid,
                             },
                         )
                 else:
@@ -679,21 +922,22 @@ class FlaskApp:
                         extra={
                             "event": "initial_state_error",
                             "error": error_msg,
-                            "sid": request.sid,
+                            "sid": sid,
                         },
                     )
                     try:
                         self.socketio.emit(
                             "error",
                             {"message": error_msg},
-                            room=request.sid,
+                            room=sid,
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Failed to send error message due to socket error: {str(e)}",
+                            "Failed to send error message due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
-                                "sid": request.sid,
+                                "sid": sid,
                             },
                         )
 
@@ -704,34 +948,41 @@ class FlaskApp:
                     "Error in WebSocket connect handler",
                     extra={
                         "event": "websocket_connect_error",
-                        "client": request.remote_addr,
-                        "sid": request.sid,
+                        "client": client_addr,
+                        "sid": sid,
                     },
                 )
                 return False  # Reject the connection on error
 
         @self.socketio.on("disconnect")
         def handle_disconnect(reason):
+            sid = request.sid
+            client_addr = request.remote_addr
             try:
                 # Log at DEBUG level for routine disconnections
                 logger.debug(
                     "Client disconnected from WebSocket",
                     extra={
                         "event": "websocket_disconnect",
-                        "client": request.remote_addr,
-                        "sid": request.sid,
+                        "client": client_addr,
+                        "sid": sid,
                         "reason": reason,
                     },
                 )
 
+                # Stop any log streams still running for this client
+                for (stream_sid, _), stop_event in list(self.active_streams.items()):
+                    if stream_sid == sid:
+                        stop_event.set()
+
                 # Only log at INFO level for admin disconnections
                 if hasattr(request, "args") and request.args.get("admin") == "true":
                     logger.info(
                         "Admin client disconnected from WebSocket",
                         extra={
                             "event": "admin_websocket_disconnect",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                             "reason": reason,
                         },
                     )
@@ -763,6 +1014,10 @@ class FlaskApp:
         @self.socketio.on("start_log_stream")
         def handle_start_log_stream(data):
             """Handle start of log streaming for a container."""
+            # Read request attributes once; the background task below cannot
+            # access the request context anyway
+            sid = request.sid
+            client_addr = request.remote_addr
             try:
                 if not isinstance(data, dict):
                     logger.warning(
@@ -770,22 +1025,23 @@ class FlaskApp:
                         extra={
                             "event": "log_stream_error",
                             "error": "Input must be a dictionary",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                         },
                     )
                     try:
                         self.socketio.emit(
                             "error",
                             {"error": "Malformed request"},
-                            room=request.sid,
+                            room=sid,
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Failed to send error message due to socket error: {str(e)}",
+                            "Failed to send error message due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
-                                "sid": request.sid,
+                                "sid": sid,
                             },
                         )
                     return
@@ -797,22 +1053,52 @@ class FlaskApp:
                         extra={
                             "event": "log_stream_error",
                             "error": "Container ID is required",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                         },
                     )
                     try:
                         self.socketio.emit(
                             "error",
                             {"error": "Container ID is required"},
-                            room=request.sid,
+                            room=sid,
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Failed to send error message due to socket error: {str(e)}",
+                            "Failed to send error message due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
-                                "sid": request.sid,
+                                "sid": sid,
+                            },
+                        )
+                    return
+
+                if not isinstance(container_id, str) or not _CONTAINER_ID_RE.match(
+                    container_id
+                ):
+                    logger.warning(
+                        "Invalid container ID in log stream request",
+                        extra={
+                            "event": "log_stream_error",
+                            "error": "Invalid container id",
+                            "client": client_addr,
+                            "sid": sid,
+                        },
+                    )
+                    try:
+                        self.socketio.emit(
+                            "error",
+                            {"error": "Invalid container id"},
+                            room=sid,
+                        )
+                    except Exception as e:
+                        logger.debug(
+                            "Failed to send error message due to socket error: %s",
+                            e,
+                            extra={
+                                "event": "socket_error",
+                                "sid": sid,
                             },
                         )
                     return
@@ -822,36 +1108,35 @@ class FlaskApp:
                     extra={
                         "event": "log_stream_start",
                         "container_id": container_id,
-                        "client": request.remote_addr,
-                        "sid": request.sid,
+                        "client": client_addr,
+                        "sid": sid,
                     },
                 )
 
                 # Check if there's already an active stream for this container/client
-                stream_key = f"{request.sid}_{container_id}"
-                if stream_key in self.active_streams:
+                stream_key = (sid, container_id)
+                existing_stop_event = self.active_streams.get(stream_key)
+                if existing_stop_event is not None:
                     # If there's an existing stream, stop it first
                     logger.info(
                         "Stopping existing log stream before starting a new one",
                         extra={
                             "event": "log_stream_restart",
                             "container_id": container_id,
-                            "sid": request.sid,
+                            "sid": sid,
                         },
                     )
-                    self.active_streams[stream_key] = True  # Signal to stop
+                    existing_stop_event.set()
                     # Give a short delay to allow the existing stream to clean up
-                    eventlet.sleep(0.1)
-
-                # Create a new stream key
-                self.active_streams[stream_key] = False  # False means don't stop
+                    self.socketio.sleep(0.1)
 
-                # Capture request context values before starting the background task
-                sid = request.sid
+                # Register the stop signal for the new stream; it is set on
+                # stop_log_stream, on disconnect or when the stream is replaced
+                stop_event = threading.Event()
+                self.active_streams[stream_key] = stop_event
 
                 def stream_logs_background():
                     """Background task to stream container logs to the client."""
-                    # Use captured sid instead of request.sid to avoid "Working outside of request context" error
                     try:
                         # Get initial logs to send to the client
                         initial_logs, error = self.docker_service.get_container_logs(
@@ -875,7 +1160,8 @@ class FlaskApp:
                                 )
                             except Exception as e:
                                 logger.debug(
-                                    f"Failed to send error message due to socket error: {str(e)}",
+                                    "Failed to send error message due to socket error: %s",
+                                    e,
                                     extra={
                                         "event": "socket_error",
                                         "sid": sid,
@@ -909,7 +1195,8 @@ class FlaskApp:
                             )
                         except Exception as e:
                             logger.debug(
-                                f"Failed to send initial logs due to socket error: {str(e)}",
+                                "Failed to send initial logs due to socket error: %s",
+                                e,
                                 extra={
                                     "event": "socket_error",
                                     "sid": sid,
@@ -921,9 +1208,10 @@ class FlaskApp:
                         last_log_time = None
                         if initial_logs:
                             try:
-                                log_lines = initial_logs.strip().split("\n")
-                                if log_lines:
-                                    last_line = log_lines[-1]
+                                # Only the last line matters; avoid splitting
+                                # the whole backlog into a list
+                                last_line = initial_logs.strip().rpartition("\n")[2]
+                                if last_line:
                                     timestamp_match = re.match(
                                         r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})",
                                         last_line,
@@ -931,8 +1219,8 @@ class FlaskApp:
                                     if timestamp_match:
                                         timestamp_str = timestamp_match.group(1)
                                         last_log_time = int(
-                                            datetime.strptime(
-                                                timestamp_str, "%Y-%m-%dT%H:%M:%S"
+                                            datetime.fromisoformat(
+                                                timestamp_str
                                             ).timestamp()
                                         )
                                         logger.debug(
@@ -947,7 +1235,8 @@ class FlaskApp:
                                         )
                             except Exception as e:
                                 logger.warning(
-                                    f"Failed to parse log timestamp: {e}",
+                                    "Failed to parse log timestamp: %s",
+                                    e,
                                     extra={
                                         "event": "log_stream_timestamp_error",
                                         "container_id": container_id,
@@ -974,11 +1263,13 @@ class FlaskApp:
 
                         if log_generator:
                             log_count = 0
-                            for log_line in log_generator:
+                            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                            info_enabled = logger.isEnabledFor(logging.INFO)
+                            for log_batch in self._iter_log_batches(
+                                log_generator, stop_event
+                            ):
                                 # Check if client disconnected or requested stop
-                                if sid not in self.socketio.server.manager.rooms.get(
-                                    "/", {}
-                                ) or self.active_streams.get(stream_key, True):
+                                if stop_event.is_set():
                                     logger.info(
                                         "Client disconnected or requested stop, stopping log stream",
                                         extra={
@@ -990,29 +1281,32 @@ class FlaskApp:
                                     )
                                     break
 
-                                # Send the log line to the client
+                                # Send the batch of log lines to the client
                                 try:
                                     self.socketio.emit(
-                                        "log_update",
-                                        {"container_id": container_id, "log": log_line},
+                                        "log_update_batch",
+                                        {"container_id": container_id, "logs": log_batch},
                                         room=sid,
                                     )
-                                    log_count += 1
+                                    previous_count = log_count
+                                    log_count += len(log_batch)
 
-                                    # Log every 10 lines in debug mode for troubleshooting
-                                    if log_count % 10 == 0:
+                                    if debug_enabled:
                                         logger.debug(
-                                            f"Streamed {log_count} log lines for container",
+                                            "Streamed %s log lines for container",
+                                            log_count,
                                             extra={
                                                 "event": "log_stream_progress",
                                                 "container_id": container_id,
                                                 "lines_streamed": log_count,
+                                                "batch_size": len(log_batch),
                                                 "sid": sid,
                                             },
                                         )
                                 except Exception as e:
                                     logger.debug(
-                                        f"Failed to send log update due to socket error: {str(e)}",
+                                        "Failed to send log update due to socket error: %s",
+                                        e,
                                         extra={
                                             "event": "socket_error",
                                             "sid": sid,
@@ -1022,9 +1316,14 @@ class FlaskApp:
                                     break
 
                                 # Optionally log a summary every 1000 lines
-                                if log_count % 1000 == 0:
+                                if (
+                                    info_enabled
+                                    and log_count // 1000 > previous_count // 1000
+                                ):
                                     logger.info(
-                                        f"Streamed {log_count} log lines for container {container_id}",
+                                        "Streamed %s log lines for container %s",
+                                        log_count,
+                                        container_id,
                                         extra={
                                             "event": "log_stream_progress",
                                             "container_id": container_id,
@@ -1035,7 +1334,9 @@ class FlaskApp:
 
                             # Log summary at the end of streaming
                             logger.info(
-                                f"Completed streaming {log_count} log lines for container {container_id}",
+                                "Completed streaming %s log lines for container %s",
+                                log_count,
+                                container_id,
                                 extra={
                                     "event": "log_stream_complete",
                                     "container_id": container_id,
@@ -1061,7 +1362,8 @@ class FlaskApp:
                                 )
                             except Exception as e:
                                 logger.debug(
-                                    f"Failed to send error message due to socket error: {str(e)}",
+                                    "Failed to send error message due to socket error: %s",
+                                    e,
                                     extra={
                                         "event": "socket_error",
                                         "sid": sid,
@@ -1069,7 +1371,7 @@ class FlaskApp:
                                 )
 
                         # Clean up stream key when done
-                        if stream_key in self.active_streams:
+                        if self.active_streams.get(stream_key) is stop_event:
                             del self.active_streams[stream_key]
 
                     except Exception as e:
@@ -1091,7 +1393,8 @@ class FlaskApp:
                             )
                         except Exception as socket_err:
                             logger.debug(
-                                f"Failed to send error message due to socket error: {str(socket_err)}",
+                                "Failed to send error message due to socket error: %s",
+                                socket_err,
                                 extra={
                                     "event": "socket_error",
                                     "sid": sid,
@@ -1099,11 +1402,11 @@ class FlaskApp:
                             )
 
                         # Clean up stream key on error
-                        if stream_key in self.active_streams:
+                        if self.active_streams.get(stream_key) is stop_event:
                             del self.active_streams[stream_key]
 
                 # Start the background task to stream logs
-                eventlet.spawn(stream_logs_background)
+                self.socketio.start_background_task(stream_logs_background)
                 return {"status": "stream_started"}
 
             except Exception as e:
@@ -1113,20 +1416,22 @@ class FlaskApp:
                         "error": str(e),
                         "event": "log_stream_error",
                         "container_id": data.get("container_id", "unknown"),
-                        "sid": request.sid,
+                        "sid": sid,
                     },
                     exc_info=True,
                 )
                 self.socketio.emit(
                     "error",
                     {"error": f"Error streaming logs: {str(e)}"},
-                    room=request.sid,
+                    room=sid,
                 )
                 return {"status": "error", "message": str(e)}
 
         @self.socketio.on("stop_log_stream")
         def handle_stop_log_stream(data):
             """Handle stop of log streaming for a container."""
+            sid = request.sid
+            client_addr = request.remote_addr
             try:
                 if not isinstance(data, dict):
                     logger.warning(
@@ -1134,8 +1439,8 @@ class FlaskApp:
                         extra={
                             "event": "log_stream_error",
                             "error": "Input must be a dictionary",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                         },
                     )
                     return
@@ -1147,8 +1452,8 @@ class FlaskApp:
                         extra={
                             "event": "log_stream_error",
                             "error": "Container ID is required",
-                            "client": request.remote_addr,
-                            "sid": request.sid,
+                            "client": client_addr,
+                            "sid": sid,
                         },
                     )
                     return
@@ -1158,28 +1463,29 @@ class FlaskApp:
                     extra={
                         "event": "log_stream_stop",
                         "container_id": container_id,
-                        "client": request.remote_addr,
-                        "sid": request.sid,
+                        "client": client_addr,
+                        "sid": sid,
                     },
                 )
 
-                # Set the stop flag for this stream
-                stream_key = f"{request.sid}_{container_id}"
-                if stream_key in self.active_streams:
-                    self.active_streams[stream_key] = True  # True means stop
+                # Signal the stream to stop
+                stop_event = self.active_streams.get((sid, container_id))
+                if stop_event is not None:
+                    stop_event.set()
 
                 try:
                     self.socketio.emit(
                         "log_stream_stopped",
                         {"container_id": container_id, "message": "Log stream stopped"},
-                        room=request.sid,
+                        room=sid,
                     )
                 except Exception as e:
                     logger.debug(
-                        f"Failed to send log stream stopped message due to socket error: {str(e)}",
+                        "Failed to send log stream stopped message due to socket error: %s",
+                        e,
                         extra={
                             "event": "socket_error",
-                            "sid": request.sid,
+                            "sid": sid,
                         },
                     )
 
@@ -1189,57 +1495,133 @@ class FlaskApp:
                     extra={
                         "error": str(e),
                         "event": "log_stream_error",
-                        "sid": request.sid,
+                        "sid": sid,
                     },
                     exc_info=True,
                 )
 
-    def is_rate_limited(self):
-        """Check if the current request is rate limited."""
-        now = datetime.now(timezone.utc)
-        current_minute = now.replace(second=0, microsecond=0)
+    def _iter_log_batches(self, log_generator, stop_event):
+        """Yield lists of log lines read from a blocking log generator.
+
+        The generator is drained by a background task into a queue holding at
+        most LOG_QUEUE_MAX_LINES lines, so a slow consumer holds the reader
+        back rather than letting the backlog grow. Each batch holds the lines
+        that arrive within LOG_BATCH_MAX_DELAY of its first line (at most
+        LOG_BATCH_MAX_LINES), so busy containers produce few large events while
+        a quiet container's lines are delayed only briefly. Setting stop_event
+        ends the generator once the queued lines have been yielded.
+        """
+        lines = queue.Queue(maxsize=LOG_QUEUE_MAX_LINES)
+        finished = object()
+
+        def is_end(item):
+            return item is finished or isinstance(item, Exception)
+
+        def put(item):
+            # Wait for room in the queue, giving up once the consumer stops
+            while not stop_event.is_set():
+                try:
+                    lines.put(item, timeout=LOG_BATCH_MAX_DELAY)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def read_lines():
+            end = finished
+            try:
+                for log_line in log_generator:
+                    if not put(log_line):
+                        return
+            except Exception as e:
+                end = e
+            put(end)
+
+        def next_line():
+            # Poll so a stop is noticed even while the reader has nothing to put
+            while True:
+                try:
+                    return lines.get(timeout=LOG_BATCH_MAX_DELAY)
+                except queue.Empty:
+                    if stop_event.is_set():
+                        return finished
+
+        self.socketio.start_background_task(read_lines)
+
+        try:
+            while True:
+                batch = [next_line()]
+                deadline = time.monotonic() + LOG_BATCH_MAX_DELAY
+                while len(batch) < LOG_BATCH_MAX_LINES and not is_end(batch[-1]):
+                    remaining = deadline - time.monotonic()
+                    try:
+                        if remaining > 0:
+                            batch.append(lines.get(timeout=remaining))
+                        else:
+                            batch.append(lines.get_nowait())
+                    except queue.Empty:
+                        break
+
+                # The end marker or the reader's error is always the last item
+                last = batch[-1]
+                if is_end(last):
+                    batch.pop()
+                    if batch:
+                        yield batch
+                    if last is finished:
+                        return
+                    raise last
+
+                yield batch
+        finally:
+            # Make sure the reader stops once nobody consumes its lines
+            stop_event.set()
 
-        # Always clean up old request counts before checking the limit
-        self.cleanup_request_counts()
-        self.last_cleanup = now
+    def is_rate_limited(self):
+        """Check if the current request is rate limited.
+
+        Requests are counted in one-second buckets over a sliding 60 second
+        window, so both checking and recording a request are O(1).
+        """
+        now = int(time.monotonic())
+        buckets = self._second_buckets
+
+        # Expire the buckets for every second that passed since the last request
+        elapsed = now - self._last_second
+        if elapsed:
+            if elapsed >= RATE_LIMIT_WINDOW:
+                buckets[:] = _EMPTY_BUCKETS
+                self._window_count = 0
+            else:
+                for second in range(self._last_second + 1, now + 1):
+                    index = second % RATE_LIMIT_WINDOW
+                    self._window_count -= buckets[index]
+                    buckets[index] = 0
+            self._last_second = now
 
         # Check if rate limit is exceeded
-        current_count = self.request_counts.get(current_minute, 0)
-        if current_count >= self.current_rate_limit:
+        if self._window_count >= self.current_rate_limit:
             return True
 
         # Increment request count
-        self.request_counts[current_minute] = current_count + 1
+        buckets[now % RATE_LIMIT_WINDOW] += 1
+        self._window_count += 1
         return False
 
-    def cleanup_request_counts(self):
-        """Clean up old request counts."""
-        now = datetime.now(timezone.utc)
-        current_minute = now.replace(second=0, microsecond=0)
-        # Two minutes ago
-        threshold = current_minute - timedelta(minutes=2)
-
-        # Remove entries older than 2 minutes
-        old_keys = [
-            minute for minute in self.request_counts.keys() if minute < threshold
-        ]
-        for minute in old_keys:
-            del self.request_counts[minute]
-
     def run(self) -> None:
         """Run the application."""
         try:
             host = self.app.config.get("HOST", "0.0.0.0")
             port = self.app.config.get("PORT", 5000)
-            logger.info(f"Starting server on {host}:{port}")
+            logger.info("Starting server on %s:%s", host, port)
             self.socketio.run(self.app, host=host, port=port)
         except Exception as e:
-            logger.error(f"Error running server: {e}")
+            logger.error("Error running server: %s", e)
             raise
         finally:
-            # Stop Docker events subscription when the application stops
-            self.docker_service.stop_event_subscription()
-            logger.info("Docker events subscription stopped")
+            # Stop the events subscription and release Docker resources
+            self.docker_service.close()
+            logger.info("Docker service closed")
 
     # Add alias for setup_socket_handlers for test compatibility
     setup_websocket_handlers = setup_socket_handlers
@@ -1256,18 +1638,23 @@ class FlaskApp:
         return decorated
 
 
+@lru_cache(maxsize=1)
+def get_flask_app() -> FlaskApp:
+    """Return the process-wide FlaskApp, building it on first use."""
+    return FlaskApp()
+
+
 def create_app():
     """Create and configure the Flask application."""
     # Only create the app if it's not being imported for testing
     if not sys.modules.get("pytest"):
-        flask_app = FlaskApp()
-        return flask_app.app
+        return get_flask_app().app
     return None
 
 
-# Create the global app instance for Gunicorn to use
-app = create_app()
-
-# Only create the app if this module is being run directly
 if __name__ == "__main__":
+    # Development server: build the single FlaskApp instance and run it
+    get_flask_app().run()
+else:
+    # Create the global app instance for Gunicorn to use
     app = create_app()
@@ -1,15 +1,124 @@
 import logging
 import threading
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Generator, List, Optional, Tuple
+from functools import lru_cache
+from typing import Generator, List, Optional, Tuple, Union
 
 import docker
 
 logger = logging.getLogger(__name__)
 
+# Connections kept in docker-py's Unix socket pool. Every followed log stream
+# holds one for its lifetime, and listings inspect containers concurrently, so
+# the default of 10 would be exhausted and connections churned.
+DOCKER_MAX_POOL_SIZE = 32
+
+# Docker event status -> container state reported to clients
+_EVENT_STATE_MAP = {
+    "create": "created",
+    "start": "running",
+    "pause": "paused",
+    "unpause": "running",
+    "stop": "stopped",
+    "kill": "stopped",
+    "die": "stopped",
+    "destroy": "deleted",
+    "restart": "running",
+    "starting": "starting",
+    "stopping": "stopping",
+    "restarting": "restarting",
+}
+
+# Container states whose changes are logged at INFO level
+_SIGNIFICANT_STATES = frozenset(
+    {
+        "created",
+        "running",
+        "stopped",
+        "deleted",
+        "starting",
+        "stopping",
+        "restarting",
+        "paused",
+        "unpaused",
+    }
+)
+
+
+def _parse_docker_time(value) -> Optional[datetime]:
+    """Parse a Docker API timestamp into an aware datetime, or None if invalid.
+
+    datetime.fromisoformat accepts the API's "Z" suffix and nanosecond
+    fractions directly (Python 3.11+), so the string is not rewritten first.
+    """
+    try:
+        created = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return created
+
+
+@lru_cache(maxsize=256)
+def _compose_project_display_name(project: str) -> str:
+    """Return the display name for a Compose project: my-project -> My Project.
+
+    Cached because every container of a project asks for the same name on
+    every listing.
+    """
+    words = project.replace("-", " ").replace("_", " ").split()
+    formatted_project = " ".join(word.capitalize() for word in words)
+    return f"Docker Compose: {formatted_project}"
+
+
+# Container Config keys that Docker fills in from the image when they are not
+# set explicitly at creation
+_IMAGE_DEFAULT_KEYS = (
+    "Cmd",
+    "Entrypoint",
+    "Healthcheck",
+    "StopSignal",
+    "User",
+    "WorkingDir",
+)
+# Keys whose entries are merged with the image's rather than replacing them
+_IMAGE_MERGED_KEYS = ("Env", "ExposedPorts", "Labels", "Volumes")
+
+
+def _strip_image_defaults(config: dict, image_config: dict) -> dict:
+    """Return a copy of a container Config without values it got from its image.
+
+    An inspected Config holds the image's defaults merged with whatever was
+    set when the container was created. Passing it back unchanged would pin
+    the old image's defaults on a container created from a newer image, so
+    only the values that differ from image_config are kept.
+    """
+    config = dict(config)
+    for key in _IMAGE_DEFAULT_KEYS:
+        if key in config and config[key] == image_config.get(key):
+            del config[key]
+    for key in _IMAGE_MERGED_KEYS:
+        value = config.get(key)
+        inherited = image_config.get(key) or ()
+        if isinstance(value, list):
+            value = [item for item in value if item not in inherited]
+        elif isinstance(value, dict):
+            value = {
+                name: item
+                for name, item in value.items()
+                if name not in inherited or inherited[name] != item
+            }
+        if value:
+            config[key] = value
+        else:
+            config.pop(key, None)
+    return config
 
-@dataclass
+
+@dataclass(slots=True)
 class Container:
     id: str
     name: str
@@ -20,9 +129,14 @@ class Container:
     ports: str
     compose_project: Optional[str] = None
     compose_service: Optional[str] = None
+    # ISO 8601 form of created, computed once for JSON payloads
+    created_iso: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.created_iso = self.created.isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     id: str
     tags: List[str]
@@ -36,14 +150,23 @@ class Image:
 class DockerService:
     def __init__(self, socketio=None):
         try:
-            self.client = docker.from_env()
+            self.client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
             self.socketio = socketio
             self._event_thread = None
             self._stop_event = threading.Event()
+            self._container_event_listeners = []
+            # Runs independent Docker API calls alongside each other, such as
+            # the per-container inspects of a listing or the pull of a rebuild.
+            # Sized from the connection pool, leaving most connections to the
+            # followed log streams.
+            self._pool = ThreadPoolExecutor(
+                max_workers=DOCKER_MAX_POOL_SIZE // 4,
+                thread_name_prefix="docker-service",
+            )
             self.request_counts = {}
             self.current_rate_limit = 100  # or whatever limit is appropriate
         except Exception as e:
-            logger.error(f"Failed to initialize Docker client: {e}")
+            logger.error("Failed to initialize Docker client: %s", e)
             raise
 
     def get_current_minute(self):
@@ -76,84 +199,62 @@ class DockerService:
         if not container_info:
             return ""
 
-        ports = []
-        port_bindings = container_info.get("HostConfig", {}).get("PortBindings", {})
+        port_bindings = (container_info.get("HostConfig") or {}).get("PortBindings")
 
         # Ensure port_bindings is a dictionary
         if not port_bindings or not isinstance(port_bindings, dict):
             return ""
 
-        for container_port, host_bindings in port_bindings.items():
-            if host_bindings:
-                for binding in host_bindings:
-                    host_port = binding.get("HostPort", "")
-                    if host_port:
-                        ports.append(f"{host_port}->{container_port}")
-
-        return ", ".join(ports) if ports else ""
+        return ", ".join(
+            f"{host_port}->{container_port}"
+            for container_port, host_bindings in port_bindings.items()
+            if host_bindings
+            for binding in host_bindings
+            if (host_port := binding.get("HostPort"))
+        )
 
     def _extract_compose_info(self, labels: dict) -> tuple[str, str]:
         """
         Extract Docker Compose project and service information from container labels.
-        Falls back to parsing the container name if labels are not set.
+        Docker Compose always sets the project and service labels, so containers
+        without a project label are treated as standalone.
         Returns a formatted project name and service name.
         """
-        # Ensure labels is a dictionary
-        if labels is None:
-            labels = {}
+        if not labels:
+            return "Standalone Containers", "unknown"
 
-        # Try to get values from the Compose labels.
         compose_project = labels.get("com.docker.compose.project")
-        compose_service = labels.get("com.docker.compose.service")
-
-        # If no project label is present, attempt to parse from the container name.
         if not compose_project:
-            container_name = labels.get("com.docker.compose.container-name", "")
-            if container_name:
-                # Docker Compose container names typically follow the pattern: project_service_index
-                parts = container_name.split("_")
-                if len(parts) >= 2:
-                    compose_project = parts[0]
-                    compose_service = parts[1]
-                else:
-                    compose_project = "Standalone Containers"
-                    compose_service = container_name
-            else:
-                compose_project = "Standalone Containers"
-                compose_service = "unknown"
-        else:
-            # If project exists but service is missing, try to infer service from container name.
-            if not compose_service:
-                container_name = labels.get("com.docker.compose.container-name", "")
-                if container_name:
-                    parts = container_name.split("_")
-                    if len(parts) >= 2:
-                        compose_service = parts[1]
-                    else:
-                        compose_service = container_name
-                else:
-                    compose_service = "unknown"
+            return "Standalone Containers", "unknown"
 
         # Format the project name to be more user-friendly
-        if compose_project and compose_project != "Standalone Containers":
-            # Convert project name to a more readable format: my-project-name -> My Project Name
-            formatted_project = " ".join(
-                word.capitalize()
-                for word in compose_project.replace("-", " ").replace("_", " ").split()
-            )
-            compose_project = f"Docker Compose: {formatted_project}"
-
-        return compose_project, compose_service
+        return (
+            _compose_project_display_name(compose_project),
+            labels.get("com.docker.compose.service") or "unknown",
+        )
 
     def get_all_containers(self) -> Tuple[Optional[List[Container]], Optional[str]]:
         """Get all containers with their details."""
         try:
-            docker_containers = self.client.containers.list(all=True)
+            # containers.list() would inspect every container one after another
+            # and each .image access would add another request. Instead take
+            # the ids from one listing call, resolve image names from one image
+            # listing, and run the inspects (needed for the state flags and the
+            # configured port bindings) side by side.
+            summaries = self.client.api.containers(all=True)
+            image_names = self._pool.submit(self._image_names)
+            container_infos = self._pool.map(
+                self._inspect_container, [summary["Id"] for summary in summaries]
+            )
+            image_names = image_names.result()
             containers = []
 
-            for docker_container in docker_containers:
+            for container_info in container_infos:
+                if container_info is None:
+                    # Removed between the listing and the inspect
+                    continue
+                container_id = container_info.get("Id")
                 try:
-                    container_info = docker_container.attrs
                     state_info = container_info.get("State", {})
                     config = container_info.get("Config", {})
                     labels = config.get("Labels", {})
@@ -173,25 +274,20 @@ class DockerService:
                         computed_state = "stopped"
 
                     created_str = container_info["Created"]
-                    try:
-                        # Handle potential 'Z' suffix for UTC
-                        if created_str.endswith("Z"):
-                            created_str = created_str[:-1] + "+00:00"
-                        created = datetime.fromisoformat(created_str)
-                        if created.tzinfo is None:
-                            created = created.replace(tzinfo=timezone.utc)
-                    except ValueError:
+                    created = _parse_docker_time(created_str)
+                    if created is None:
                         logger.warning(
-                            f"Could not parse timestamp '{created_str}' for container {docker_container.id}. Falling back."
+                            "Could not parse timestamp '%s' for container %s. Falling back.",
+                            created_str,
+                            container_id,
                         )
                         created = datetime.now(timezone.utc)
 
+                    image_id = container_info.get("Image", "")
                     container = Container(
-                        id=docker_container.id,
-                        name=docker_container.name,
-                        image=docker_container.image.tags[0]
-                        if docker_container.image.tags
-                        else docker_container.image.id,
+                        id=container_id,
+                        name=container_info["Name"].lstrip("/"),
+                        image=image_names.get(image_id, image_id),
                         status=state_info.get(
                             "Status", "unknown"
                         ),  # Keep the detailed status
@@ -210,17 +306,21 @@ class DockerService:
                         or "ValueError" in str(e)
                     ):
                         logger.debug(
-                            f"Skipping container {docker_container.id}: {e}",
+                            "Skipping container %s: %s",
+                            container_id,
+                            e,
                             extra={
-                                "container_id": docker_container.id,
+                                "container_id": container_id,
                                 "error_type": type(e).__name__,
                             },
                         )
                     else:
                         logger.error(
-                            f"Failed to process container {docker_container.id}: {e}",
+                            "Failed to process container %s: %s",
+                            container_id,
+                            e,
                             extra={
-                                "container_id": docker_container.id,
+                                "container_id": container_id,
                                 "error_type": type(e).__name__,
                             },
                         )
@@ -233,6 +333,24 @@ class DockerService:
             logger.error(error_msg)
             return None, error_msg
 
+    def _inspect_container(self, container_id: str) -> Optional[dict]:
+        """Inspect a container for the listing, or None if it no longer exists."""
+        try:
+            return self.client.api.inspect_container(container_id)
+        except docker.errors.NotFound:
+            return None
+
+    def _image_names(self) -> dict:
+        """Map image id to its first tag, from a single image listing."""
+        image_names = {}
+        for image in self.client.api.images():
+            tags = [
+                tag for tag in image.get("RepoTags") or () if tag != "<none>:<none>"
+            ]
+            if tags:
+                image_names[image["Id"]] = tags[0]
+        return image_names
+
     def get_container_logs(
         self, container_id: str, lines: int = 100
     ) -> Tuple[Optional[str], Optional[str]]:
@@ -251,16 +369,24 @@ class DockerService:
             return None, error_msg
 
     def stream_container_logs(
-        self, container_id: str, since: Optional[int] = None
+        self,
+        container_id: str,
+        since: Optional[int] = None,
+        follow: bool = True,
+        tail: Union[int, str] = 100,
     ) -> Generator[str, None, None]:
-        """Stream logs for a specific container."""
+        """Stream logs for a specific container.
+
+        With follow=False the generator ends once the existing logs are read;
+        tail ("all" or a line count) only applies when since is not given.
+        """
         try:
             container = self.client.containers.get(container_id)
 
             # Configure streaming options for real-time logs
             kwargs = {
                 "stream": True,  # Enable streaming
-                "follow": True,  # Follow log output
+                "follow": follow,  # Follow log output
                 "timestamps": True,  # Include timestamps
             }
 
@@ -270,7 +396,9 @@ class DockerService:
                 # When using 'since', set tail=0 to avoid duplicate logs
                 kwargs["tail"] = 0
                 logger.info(
-                    f"Starting log stream for container {container_id} from timestamp {since}",
+                    "Starting log stream for container %s from timestamp %s",
+                    container_id,
+                    since,
                     extra={
                         "container_id": container_id,
                         "since": since,
@@ -279,12 +407,13 @@ class DockerService:
                 )
             else:
                 # If no timestamp provided, just get recent logs
-                kwargs["tail"] = 100
+                kwargs["tail"] = tail
                 logger.info(
-                    f"Starting log stream for container {container_id} with recent logs",
+                    "Starting log stream for container %s with recent logs",
+                    container_id,
                     extra={
                         "container_id": container_id,
-                        "tail": 100,
+                        "tail": tail,
                         "stream_options": str(kwargs),
                     },
                 )
@@ -294,6 +423,7 @@ class DockerService:
 
             # Process and yield each log line
             log_count = 0
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             for chunk in stream:
                 log_count += 1
                 if isinstance(chunk, bytes):
@@ -302,9 +432,11 @@ class DockerService:
                     )  # Handle encoding errors gracefully
 
                     # Log every 10th line to avoid excessive logging
-                    if log_count % 10 == 0:
+                    if debug_enabled and log_count % 10 == 0:
                         logger.debug(
-                            f"Streaming log line {log_count} for container {container_id}",
+                            "Streaming log line %s for container %s",
+                            log_count,
+                            container_id,
                             extra={
                                 "container_id": container_id,
                                 "log_line_length": len(log_line),
@@ -317,7 +449,9 @@ class DockerService:
 
             # Log when the stream ends (this should only happen if the container stops)
             logger.info(
-                f"Log stream ended for container {container_id} after {log_count} lines",
+                "Log stream ended for container %s after %s lines",
+                container_id,
+                log_count,
                 extra={
                     "container_id": container_id,
                     "total_lines": log_count,
@@ -364,7 +498,8 @@ class DockerService:
                     try:
                         self.socketio.emit("container_state_changed", container_data)
                         logger.debug(
-                            f"Emitted deleted state for container {container_id}",
+                            "Emitted deleted state for container %s",
+                            container_id,
                             extra={
                                 "event": "container_deleted",
                                 "container_id": container_id,
@@ -372,7 +507,8 @@ class DockerService:
                         )
                     except Exception as e:
                         logger.debug(
-                            f"Failed to emit container deleted state due to socket error: {str(e)}",
+                            "Failed to emit container deleted state due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
                                 "container_id": container_id,
@@ -386,7 +522,8 @@ class DockerService:
                 except docker.errors.NotFound:
                     # Container not found, likely already deleted
                     logger.debug(
-                        f"Container {container_id} not found when emitting state change, likely already deleted",
+                        "Container %s not found when emitting state change, likely already deleted",
+                        container_id,
                         extra={
                             "event": "container_not_found",
                             "container_id": container_id,
@@ -409,7 +546,8 @@ class DockerService:
                         self.socketio.emit("container_state_changed", container_data)
                     except Exception as e:
                         logger.debug(
-                            f"Failed to emit container state change due to socket error: {str(e)}",
+                            "Failed to emit container state change due to socket error: %s",
+                            e,
                             extra={
                                 "event": "socket_error",
                                 "container_id": container_id,
@@ -448,7 +586,8 @@ class DockerService:
                             )
                         except Exception as e:
                             logger.debug(
-                                f"Failed to emit container state change due to socket error: {str(e)}",
+                                "Failed to emit container state change due to socket error: %s",
+                                e,
                                 extra={
                                     "event": "socket_error",
                                     "container_id": container_id,
@@ -499,17 +638,9 @@ class DockerService:
                 created_str = container_info.get("Created", "")
                 created = None
                 if created_str:
-                    try:
-                        created = datetime.fromisoformat(
-                            created_str.replace("Z", "+00:00")
-                        )
-                    except (ValueError, TypeError):
-                        try:
-                            created = datetime.strptime(
-                                created_str, "%Y-%m-%dT%H:%M:%S.%fZ"
-                            )
-                        except (ValueError, TypeError):
-                            created = datetime.now(timezone.utc)
+                    created = _parse_docker_time(created_str) or datetime.now(
+                        timezone.utc
+                    )
 
                 # IMPORTANT: Override the container state with the event state
                 # This ensures the UI reflects the actual transition state
@@ -567,7 +698,10 @@ class DockerService:
                     self.socketio.emit("container_state_changed", container_data)
 
                     logger.debug(
-                        f"Emitted container state change: {container_id} -> {actual_state} (status: {status})",
+                        "Emitted container state change: %s -> %s (status: %s)",
+                        container_id,
+                        actual_state,
+                        status,
                         extra={
                             "event": "container_state_change_emitted",
                             "container_id": container_id,
@@ -578,7 +712,8 @@ class DockerService:
                     )
                 except Exception as e:
                     logger.debug(
-                        f"Failed to emit container state change due to socket error: {str(e)}",
+                        "Failed to emit container state change due to socket error: %s",
+                        e,
                         extra={
                             "event": "socket_error",
                             "container_id": container_id,
@@ -593,7 +728,9 @@ class DockerService:
                     or "AttributeError" in str(e)
                 ):
                     logger.debug(
-                        f"Error emitting container state for {container_id}: {str(e)}",
+                        "Error emitting container state for %s: %s",
+                        container_id,
+                        e,
                         extra={
                             "event": "container_state_change_error",
                             "container_id": container_id,
@@ -603,7 +740,9 @@ class DockerService:
                     )
                 else:
                     logger.error(
-                        f"Error emitting container state for {container_id}: {str(e)}",
+                        "Error emitting container state for %s: %s",
+                        container_id,
+                        e,
                         extra={
                             "event": "container_state_change_error",
                             "container_id": container_id,
@@ -686,27 +825,60 @@ class DockerService:
             host_config = container_info["HostConfig"]
             name = container_info["Name"].lstrip("/")
             image = config["Image"]
+            image_config = self._image_config(container_info.get("Image"))
+            network_settings = container_info.get("NetworkSettings") or {}
+            networks = network_settings.get("Networks") or {}
 
-            # Stop and remove the container
+            # Pull the latest image while the old container is torn down;
+            # pulling the tag does not depend on the container being gone
+            pull = self._pool.submit(self.client.images.pull, image)
+
+            # Stop and remove the container; the Docker events subscription
+            # reports the stop to clients, so it is not re-inspected here
             container.stop()
-            self._emit_container_state(container_id, "stopped")
             container.remove()
 
-            # Pull the latest image
-            self.client.images.pull(image)
-
-            # Create and start the new container with the same configuration
-            new_container = self.client.containers.run(
-                image=image,
-                name=name,
-                detach=True,
-                ports=host_config.get("PortBindings"),
-                volumes=host_config.get("Binds"),
-                environment=config.get("Env"),
-                network_mode=host_config.get("NetworkMode", "default"),
-                labels=config.get("Labels", {}),
-            )
-            self._emit_container_state(new_container.id, "running")
+            pull.result()
+
+            # Create the new container from the inspected Config and HostConfig,
+            # so settings such as the restart policy and capabilities carry over
+            # without being rebuilt argument by argument. Values the old image
+            # supplied are dropped so the pulled image's defaults apply.
+            create_config = _strip_image_defaults(config, image_config)
+            create_config["HostConfig"] = host_config
+            # Docker defaults the hostname to the short container id; let the
+            # new container get its own
+            if container.id.startswith(create_config.get("Hostname") or ""):
+                create_config.pop("Hostname", None)
+
+            # Older API versions accept a single network at creation, so the
+            # container is created on its network mode's network and connected
+            # to the rest afterwards, keeping aliases and static addresses
+            endpoints = {
+                network: self._endpoint_settings(settings, container.id)
+                for network, settings in networks.items()
+            }
+            network_mode = host_config.get("NetworkMode")
+            if network_mode == "default":
+                network_mode = "bridge"
+            if network_mode in endpoints:
+                endpoint = self.client.api.create_endpoint_config(
+                    **endpoints.pop(network_mode)
+                )
+                networking_config = self.client.api.create_networking_config(
+                    {network_mode: endpoint}
+                )
+                create_config["NetworkingConfig"] = networking_config
+
+            new_container_id = self.client.api.create_container_from_config(
+                create_config, name=name
+            )["Id"]
+            for network, settings in endpoints.items():
+                self.client.api.connect_container_to_network(
+                    new_container_id, network, **settings
+                )
+            self.client.api.start(new_container_id)
+            self._emit_container_state(new_container_id, "running")
             return True, None
 
         except docker.errors.NotFound:
@@ -718,6 +890,34 @@ class DockerService:
             logger.error(error_msg)
             return False, error_msg
 
+    def _image_config(self, image_id: Optional[str]) -> dict:
+        """Return the Config of an image, or an empty dict if it is gone."""
+        if not image_id:
+            return {}
+        try:
+            return self.client.api.inspect_image(image_id).get("Config") or {}
+        except docker.errors.NotFound:
+            return {}
+
+    def _endpoint_settings(self, settings: dict, container_id: str) -> dict:
+        """Return endpoint arguments recreating a container's network attachment.
+
+        Docker adds the short container id as an alias on user-defined
+        networks; it is left out so the new container gets its own.
+        """
+        ipam = settings.get("IPAMConfig") or {}
+        aliases = [
+            alias
+            for alias in settings.get("Aliases") or ()
+            if alias != container_id[:12]
+        ]
+        return {
+            "aliases": aliases or None,
+            "ipv4_address": ipam.get("IPv4Address"),
+            "ipv6_address": ipam.get("IPv6Address"),
+            "link_local_ips": ipam.get("LinkLocalIPs"),
+        }
+
     def delete_container(self, container_id: str) -> Tuple[bool, Optional[str]]:
         """Delete a container."""
         try:
@@ -743,7 +943,7 @@ class DockerService:
                 "image": container.image,
                 "status": container.status,
                 "state": container.state,
-                "created": container.created.isoformat(),
+                "created": container.created,
                 "ports": container.ports,
                 "compose_project": container.compose_project,
                 "compose_service": container.compose_service,
@@ -754,9 +954,10 @@ class DockerService:
     def get_all_images(self) -> Tuple[Optional[List[Image]], Optional[str]]:
         """Get all Docker images with their details."""
         try:
-            logger.info("Fetching all Docker images")
+            logger.debug("Fetching all Docker images")
             docker_images = self.client.images.list(all=True)
             images = []
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
             for docker_image in docker_images:
                 try:
@@ -766,20 +967,16 @@ class DockerService:
                     size_mb = image_info.get("Size", 0) / (1024 * 1024)
 
                     created_str = image_info.get("Created", "")
-                    try:
-                        if created_str.endswith("Z"):
-                            created_str = created_str[:-1] + "+00:00"
-                        created = datetime.fromisoformat(created_str)
-                        if created.tzinfo is None:
-                            created = created.replace(tzinfo=timezone.utc)
-                    except (ValueError, AttributeError):
+                    created = _parse_docker_time(created_str)
+                    if created is None:
                         try:
                             created = datetime.fromtimestamp(
                                 float(created_str), timezone.utc
                             )
                         except (ValueError, TypeError):
                             logger.warning(
-                                f"Could not parse creation time for image {docker_image.id}, using current time"
+                                "Could not parse creation time for image %s, using current time",
+                                docker_image.id,
                             )
                             created = datetime.now(timezone.utc)
 
@@ -795,14 +992,17 @@ class DockerService:
                         else {},
                     )
                     images.append(image)
-                    logger.debug(
-                        f"Processed image: {image.id[:12]} with tags: {image.tags}"
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            "Processed image: %s with tags: %s",
+                            image.id[:12],
+                            image.tags,
+                        )
                 except Exception as e:
-                    logger.error(f"Error processing image: {e}")
+                    logger.error("Error processing image: %s", e)
             return images, None
         except Exception as e:
-            logger.error(f"Error fetching images: {e}")
+            logger.error("Error fetching images: %s", e)
             return None, str(e)
 
     def delete_image(
@@ -810,7 +1010,7 @@ class DockerService:
     ) -> Tuple[bool, Optional[str]]:
         """Delete a Docker image."""
         try:
-            logger.info(f"Attempting to delete image: {image_id}")
+            logger.info("Attempting to delete image: %s", image_id)
 
             # Handle different image ID formats
             # Sometimes the ID comes with 'sha256:' prefix, sometimes without
@@ -819,7 +1019,7 @@ class DockerService:
                 if not image_id.startswith("sha256:"):
                     # If no prefix, try both with and without prefix
                     logger.info(
-                        "Image ID has no sha256: prefix, trying with prefix first"
+                        "Image ID has no sha256: prefix, trying with prefix first",
                     )
                     try:
                         prefixed_id = f"sha256:{image_id}"
@@ -827,11 +1027,12 @@ class DockerService:
                             prefixed_id
                         )  # Check if image exists with prefix
                         image_id = prefixed_id
-                        logger.info(f"Found image with prefixed ID: {image_id}")
+                        logger.info("Found image with prefixed ID: %s", image_id)
                     except docker.errors.ImageNotFound:
                         # If not found with prefix, try the original ID
                         logger.info(
-                            f"Image not found with prefix, trying original ID: {image_id}"
+                            "Image not found with prefix, trying original ID: %s",
+                            image_id,
                         )
                         self.client.images.get(image_id)  # Check if image exists
             except docker.errors.ImageNotFound:
@@ -840,22 +1041,25 @@ class DockerService:
                 return False, error_msg
             except Exception as e:
                 logger.warning(
-                    f"Error checking image existence: {str(e)}, proceeding with deletion anyway"
+                    "Error checking image existence: %s, proceeding with deletion anyway",
+                    e,
                 )
 
             # Proceed with deletion
-            logger.info(f"Removing image with ID: {image_id}, force={force}")
+            logger.info("Removing image with ID: %s, force=%s", image_id, force)
             self.client.images.remove(image_id, force=force)
-            logger.info(f"Successfully deleted image: {image_id}")
+            logger.info("Successfully deleted image: %s", image_id)
             return True, None
         except docker.errors.ImageNotFound:
             # If the prefixed ID is not found, try the unprefixed version
             if image_id.startswith("sha256:"):
                 unprefixed_id = image_id.replace("sha256:", "")
-                logger.info(f"Image not found with prefix, trying without: {unprefixed_id}")
+                logger.info(
+                    "Image not found with prefix, trying without: %s", unprefixed_id
+                )
                 try:
                     self.client.images.remove(unprefixed_id, force=force)
-                    logger.info(f"Successfully deleted image: {unprefixed_id}")
+                    logger.info("Successfully deleted image: %s", unprefixed_id)
                     return True, None
                 except docker.errors.ImageNotFound:
                     error_msg = f"Image {image_id} not found (tried with and without prefix)"
@@ -895,7 +1099,7 @@ class DockerService:
                 "id": image.id,
                 "tags": image.tags,
                 "size": image.size,
-                "created": image.created.isoformat(),
+                "created": image.created,
                 "repo_digests": image.repo_digests,
                 "parent_id": image.parent_id,
                 "labels": image.labels,
@@ -924,20 +1128,11 @@ class DockerService:
                         state = self._map_event_to_state(status)
 
                         # Only log significant state changes at INFO level
-                        significant_states = [
-                            "created",
-                            "running",
-                            "stopped",
-                            "deleted",
-                            "starting",
-                            "stopping",
-                            "restarting",
-                            "paused",
-                            "unpaused",
-                        ]
-                        if state in significant_states:
+                        if state in _SIGNIFICANT_STATES:
                             logger.info(
-                                f"Container {container_id} state changed to {state}",
+                                "Container %s state changed to %s",
+                                container_id,
+                                state,
                                 extra={
                                     "event": "container_state_change",
                                     "container_id": container_id,
@@ -948,7 +1143,10 @@ class DockerService:
                         else:
                             # Log routine events at DEBUG level
                             logger.debug(
-                                f"Container event: {container_id} -> {status} (mapped to {state})",
+                                "Container event: %s -> %s (mapped to %s)",
+                                container_id,
+                                status,
+                                state,
                                 extra={
                                     "event": "container_event",
                                     "container_id": container_id,
@@ -957,32 +1155,22 @@ class DockerService:
                                 },
                             )
 
+                        # Let listeners drop anything derived from the old state
+                        # before clients are told to refresh
+                        self._notify_container_event(container_id, state)
+
                         # For all container events, emit the state change
                         # This ensures the frontend is always updated with the latest state
                         self._emit_container_state(container_id, state)
 
         except Exception as e:
-            logger.error(f"Error in Docker events subscription: {e}")
+            logger.error("Error in Docker events subscription: %s", e)
         finally:
             logger.info("Docker events subscription stopped")
 
     def _map_event_to_state(self, event_status: str) -> str:
         """Map Docker event status to container state."""
-        state_mapping = {
-            "create": "created",
-            "start": "running",
-            "pause": "paused",
-            "unpause": "running",
-            "stop": "stopped",
-            "kill": "stopped",
-            "die": "stopped",
-            "destroy": "deleted",
-            "restart": "running",
-            "starting": "starting",
-            "stopping": "stopping",
-            "restarting": "restarting",
-        }
-        return state_mapping.get(event_status, event_status)
+        return _EVENT_STATE_MAP.get(event_status, event_status)
 
     def _handle_container_event(self, event):
         """Handle a Docker container event."""
@@ -991,8 +1179,21 @@ class DockerService:
 
         if container_id and status:
             state = self._map_event_to_state(status)
+            self._notify_container_event(container_id, state)
             self._emit_container_state(container_id, state)
 
+    def add_container_event_listener(self, listener) -> None:
+        """Register listener(container_id, state), called for every container event."""
+        self._container_event_listeners.append(listener)
+
+    def _notify_container_event(self, container_id: str, state: str) -> None:
+        """Call the registered container event listeners."""
+        for listener in self._container_event_listeners:
+            try:
+                listener(container_id, state)
+            except Exception as e:
+                logger.error("Container event listener failed: %s", e)
+
     def start_event_subscription(self):
         """Start the Docker events subscription in a background thread."""
         if self._event_thread is None or not self._event_thread.is_alive():
@@ -1011,6 +1212,12 @@ class DockerService:
             self._event_thread.join(timeout=2)
             logger.info("Stopped Docker event subscription")
 
+    def close(self):
+        """Stop the event subscription and release the worker pool and client."""
+        self.stop_event_subscription()
+        self._pool.shutdown(wait=False)
+        self.client.close()
+
     def prune_containers(self) -> Tuple[bool, dict, Optional[str]]:
         """
         Remove all stopped containers.
@@ -1023,7 +1230,9 @@ class DockerService:
             space_reclaimed = result.get("SpaceReclaimed", 0)
 
             logger.info(
-                f"Pruned {len(containers_deleted) if containers_deleted else 0} containers, reclaimed {space_reclaimed} bytes"
+                "Pruned %s containers, reclaimed %s bytes",
+                len(containers_deleted) if containers_deleted else 0,
+                space_reclaimed,
             )
 
             return (
@@ -1051,7 +1260,9 @@ class DockerService:
             space_reclaimed = result.get("SpaceReclaimed", 0)
 
             logger.info(
-                f"Pruned {len(images_deleted) if images_deleted else 0} images, reclaimed {space_reclaimed} bytes"
+                "Pruned %s images, reclaimed %s bytes",
+                len(images_deleted) if images_deleted else 0,
+                space_reclaimed,
             )
 
             return (
@@ -1079,7 +1290,9 @@ class DockerService:
             space_reclaimed = result.get("SpaceReclaimed", 0)
 
             logger.info(
-                f"Pruned {len(volumes_deleted) if volumes_deleted else 0} volumes, reclaimed {space_reclaimed} bytes"
+                "Pruned %s volumes, reclaimed %s bytes",
+                len(volumes_deleted) if volumes_deleted else 0,
+                space_reclaimed,
             )
 
             return (
@@ -1106,7 +1319,8 @@ class DockerService:
             networks_deleted = result.get("NetworksDeleted", [])
 
             logger.info(
-                f"Pruned {len(networks_deleted) if networks_deleted else 0} networks"
+                "Pruned %s networks",
+                len(networks_deleted) if networks_deleted else 0,
             )
 
             return True, {"networks_deleted": networks_deleted or []}, None
@@ -1123,7 +1337,7 @@ class DockerService:
         Equivalent to 'docker system prune' or 'docker system prune -a' when all_unused=True.
         """
         try:
-            logger.info(f"Pruning all unused Docker resources (all={all_unused})")
+            logger.info("Pruning all unused Docker resources (all=%s)", all_unused)
             result = self.client.system.prune(volumes=True, all=all_unused)
 
             containers_deleted = result.get("ContainersDeleted", [])
@@ -1133,11 +1347,12 @@ class DockerService:
             space_reclaimed = result.get("SpaceReclaimed", 0)
 
             logger.info(
-                f"Pruned {len(containers_deleted) if containers_deleted else 0} containers, "
-                f"{len(images_deleted) if images_deleted else 0} images, "
-                f"{len(networks_deleted) if networks_deleted else 0} networks, "
-                f"{len(volumes_deleted) if volumes_deleted else 0} volumes, "
-                f"reclaimed {space_reclaimed} bytes"
+                "Pruned %s containers, %s images, %s networks, %s volumes, reclaimed %s bytes",
+                len(containers_deleted) if containers_deleted else 0,
+                len(images_deleted) if images_deleted else 0,
+                len(networks_deleted) if networks_deleted else 0,
+                len(volumes_deleted) if volumes_deleted else 0,
+                space_reclaimed,
             )
 
             return (
@@ -7,10 +7,15 @@ import sys
 
 # Gunicorn config variables
 bind = "0.0.0.0:5000"
-worker_class = "eventlet"
+# gevent-websocket's worker upgrades Socket.IO connections to real websockets
+worker_class = "geventwebsocket.gunicorn.workers.GeventWebSocketWorker"
+# Socket.IO keeps per-client state in the worker, so more workers would need
+# sticky sessions and a message queue; one gevent worker serves many clients
 workers = 1
+worker_connections = 1000
 timeout = 120
-keepalive = 5
+# Keep idle HTTP connections open across the frontend's polling interval
+keepalive = 65
 
 # Logging configuration
 accesslog = "-"  # Log to stdout
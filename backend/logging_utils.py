@@ -1,8 +1,10 @@
+import itertools
 import json
 import logging
 import logging.handlers
+import os
+import threading
 import time
-import uuid
 from contextvars import ContextVar
 from datetime import datetime, timezone  # Added timezone import
 from functools import wraps
@@ -219,6 +221,59 @@ class SocketErrorFilter(logging.Filter):
         return True
 
 
+class RateLimitedLogger:
+    """Logger wrapper that drops records once an event exceeds a per-second budget.
+
+    Records are keyed by their extra["event"]; records without an event are
+    always logged. Dropped records are never created, so noisy paths such as
+    WebSocket connects cost almost nothing once their budget is spent.
+    """
+
+    def __init__(self, logger: logging.Logger, per_second: int = 10):
+        self.logger = logger
+        self.per_second = per_second
+        # event -> (second, records logged in that second)
+        self._windows: Dict[str, tuple] = {}
+
+    def _allow(self, extra: Optional[Dict[str, Any]]) -> bool:
+        event = extra.get("event") if extra else None
+        if event is None:
+            return True
+        now = int(time.monotonic())
+        second, count = self._windows.get(event, (now, 0))
+        if second != now:
+            count = 0
+        if count >= self.per_second:
+            return False
+        self._windows[event] = (now, count + 1)
+        return True
+
+    def log(self, level: int, msg, *args, **kwargs) -> None:
+        if self.logger.isEnabledFor(level) and self._allow(kwargs.get("extra")):
+            # Attribute the record to our caller rather than this wrapper
+            kwargs.setdefault("stacklevel", 3)
+            self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg, *args, **kwargs) -> None:
+        self.log(logging.DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs) -> None:
+        self.log(logging.INFO, msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs) -> None:
+        self.log(logging.WARNING, msg, *args, **kwargs)
+
+
+# Request IDs only need to be unique within the logs, so build them from the
+# pid, a per-process counter and a timestamp instead of reading os.urandom.
+_request_counter = itertools.count()
+
+
+def _new_request_id() -> str:
+    """Generate a cheap, process-unique request ID."""
+    return f"{os.getpid():x}-{next(_request_counter):x}-{time.monotonic_ns():x}"
+
+
 def get_request_id() -> str:
     """Get the current request ID."""
     try:
@@ -230,7 +285,7 @@ def get_request_id() -> str:
 def set_request_id(request_id: Optional[str] = None) -> str:
     """Set the request ID for the current context."""
     if request_id is None:
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
     request_id_var.set(request_id)
     return request_id
 
@@ -242,7 +297,7 @@ def log_request():
         @wraps(f)
         def wrapped(*args, **kwargs):
             # Set request ID
-            request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+            request_id = request.headers.get("X-Request-ID") or _new_request_id()
             # Set both Flask g and context var
             g.request_id = request_id
             set_request_id(request_id)
@@ -281,18 +336,19 @@ def log_request():
             LogContext.set_performance_metrics(start_time=time.time())
 
             # Log all requests at DEBUG level
-            logger.debug(
-                "Request started",
-                extra={
-                    "method": request.method,
-                    "path": request.path,
-                    "remote_addr": request.remote_addr,
-                    "request_id": request_id,
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request started",
+                    extra={
+                        "method": request.method,
+                        "path": request.path,
+                        "remote_addr": request.remote_addr,
+                        "request_id": request_id,
+                    },
+                )
 
             # Only log non-routine requests at INFO level
-            if not is_routine_request:
+            if not is_routine_request and logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "Request started",
                     extra={
@@ -333,19 +389,22 @@ def log_request():
                 )
 
                 # Always log at DEBUG level
-                logger.debug(
-                    "Request completed",
-                    extra={
-                        "method": request.method,
-                        "path": request.path,
-                        "status_code": status_code,
-                        "duration": duration,
-                        "request_id": request_id,
-                    },
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Request completed",
+                        extra={
+                            "method": request.method,
+                            "path": request.path,
+                            "status_code": status_code,
+                            "duration": duration,
+                            "request_id": request_id,
+                        },
+                    )
 
                 # Log slow requests (>500ms) or non-routine requests at INFO level
-                if duration > 0.5 or not is_routine_request or status_code >= 400:
+                if (
+                    duration > 0.5 or not is_routine_request or status_code >= 400
+                ) and logger.isEnabledFor(logging.INFO):
                     logger.info(
                         "Request completed",
                         extra={
@@ -395,6 +454,18 @@ def with_context(operation_type=None, **context_kwargs):
     return decorator
 
 
+def _replace_filter(target, log_filter):
+    """Attach a filter, dropping any filter of the same type added earlier.
+
+    Keeps repeated setup_logging() calls from stacking duplicate filters on
+    long-lived loggers and handlers.
+    """
+    for existing in target.filters[:]:
+        if isinstance(existing, type(log_filter)):
+            target.removeFilter(existing)
+    target.addFilter(log_filter)
+
+
 def setup_logging(
     log_level=None, log_file=None, max_bytes=10 * 1024 * 1024, backup_count=5
 ):
@@ -466,7 +537,7 @@ def setup_logging(
     root_logger.addHandler(file_handler)
 
     # Add socket error filter directly to root logger
-    root_logger.addFilter(socket_error_filter)
+    _replace_filter(root_logger, socket_error_filter)
 
     # Configure specific loggers
     loggers = ["docker_service", "docker_monitor"]
@@ -478,7 +549,7 @@ def setup_logging(
         # Add our custom handlers and filter
         logger.addHandler(console_handler)
         logger.addHandler(file_handler)
-        logger.addFilter(RequestIdFilter())
+        _replace_filter(logger, request_id_filter)
         logger.propagate = False  # Prevent duplicate logs
         logger.setLevel(numeric_level)
 
@@ -488,9 +559,9 @@ def setup_logging(
         engineio_logger.removeHandler(h)
     engineio_logger.addHandler(console_handler)
     engineio_logger.addHandler(file_handler)
-    engineio_logger.addFilter(RequestIdFilter())
+    _replace_filter(engineio_logger, request_id_filter)
     # Add socket error filter to engineio.server logger
-    engineio_logger.addFilter(socket_error_filter)
+    _replace_filter(engineio_logger, socket_error_filter)
     engineio_logger.propagate = False
     engineio_logger.setLevel(logging.ERROR)
 
@@ -500,8 +571,8 @@ def setup_logging(
         socketio_logger.removeHandler(h)
     socketio_logger.addHandler(console_handler)
     socketio_logger.addHandler(file_handler)
-    socketio_logger.addFilter(RequestIdFilter())
-    socketio_logger.addFilter(socket_error_filter)
+    _replace_filter(socketio_logger, request_id_filter)
+    _replace_filter(socketio_logger, socket_error_filter)
     socketio_logger.propagate = False
     socketio_logger.setLevel(logging.ERROR)
 
@@ -585,6 +656,35 @@ def structured_log(logger, level: str, message: str, **kwargs) -> None:
         log_method(message)
 
 
+# Per-thread (per-greenlet under gevent) scratch dict reused by emit(). The
+# logging machinery copies extra onto the record, so it can be cleared after.
+_emit_scratch = threading.local()
+
+
+def emit(logger, level: int, event: str, message: str, *args, **fields) -> None:
+    """Log message with extra={"event": event, **fields} if level is enabled.
+
+    Args:
+        logger: The logger instance to use
+        level: The numeric log level
+        event: The event name stored on the record
+        message: The log message, %-formatted lazily with args
+        *args: Arguments for message
+        **fields: Additional fields stored on the record
+    """
+    if not logger.isEnabledFor(level):
+        return
+    extra = getattr(_emit_scratch, "extra", None)
+    if extra is None:
+        extra = _emit_scratch.extra = {}
+    extra["event"] = event
+    extra.update(fields)
+    try:
+        logger.log(level, message, *args, extra=extra, stacklevel=2)
+    finally:
+        extra.clear()
+
+
 def track_performance(name=None, include_args=False):
     """Decorator to track and log performance metrics for a function.
 
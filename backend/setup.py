@@ -12,7 +12,9 @@ setup(
         "python-json-logger>=2.0.0",
         "prometheus-client>=0.16.0",
         "docker>=7.1.0",
-        "eventlet>=0.39.0",
+        "gevent>=24.2.1",
+        "gevent-websocket>=0.10.1",
         "flask-socketio>=5.5.1",
+        "orjson>=3.8.0",
     ],
 )
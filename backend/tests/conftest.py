@@ -196,6 +196,10 @@ def setup_logging():
         handler.addFilter(request_id_filter)
 
 
+# The rate-limited logger wrapper and emit() have no side effects, so the real
+# ones are used
+from backend.logging_utils import RateLimitedLogger, emit  # noqa: E402
+
 # Add the enhanced implementations to the logging_utils module namespace
 sys.modules["logging_utils"] = type(
     "MockLoggingUtils",
@@ -208,6 +212,8 @@ sys.modules["logging_utils"] = type(
         "setup_logging": setup_logging,
         "CustomJsonFormatter": CustomJsonFormatter,
         "request_id_var": request_id_var,
+        "RateLimitedLogger": RateLimitedLogger,
+        "emit": emit,
     },
 )
 
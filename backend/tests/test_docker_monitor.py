@@ -1,10 +1,15 @@
+import gzip
 import json
-from datetime import datetime, timedelta
+from array import array
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
+import docker
 import pytest
+from werkzeug.exceptions import NotFound
 
 # Import directly from the modules, not from backend package
+import docker_monitor
 from docker_monitor import FlaskApp
 from docker_service import Container
 
@@ -77,12 +82,8 @@ def mock_docker_service():
 @pytest.fixture
 def flask_app(mock_docker_service):
     """Create a Flask app with routes for testing."""
-    # Reset the static variables to allow clean test runs
     from docker_monitor import FlaskApp
 
-    FlaskApp._instance = None
-    FlaskApp._routes_registered = False
-
     # Patch the SocketIO class to avoid socket operations
     with patch("docker_monitor.SocketIO") as mock_socketio_class:
         mock_socketio = Mock()
@@ -115,7 +116,9 @@ def flask_app(mock_docker_service):
             app.log_stream_handler = None
 
             # Set up request counts for rate limit tests
-            app.app_instance.request_counts = {}
+            app.app_instance._second_buckets = array("i", [0] * 60)
+            app.app_instance._last_second = 0
+            app.app_instance._window_count = 0
             app.app_instance.current_rate_limit = 10
 
             yield app
@@ -148,6 +151,135 @@ class TestDockerMonitor:
         assert data["data"][0]["id"] == "test_container_id"
         flask_app.mock_docker_service.get_all_containers.assert_called_once()
 
+    def test_get_containers_cached_within_ttl(self, client, flask_app):
+        """Test that repeated listings within the TTL reuse the cached result."""
+        with patch("docker_monitor.time.monotonic", return_value=100.0):
+            first = client.get("/api/containers")
+            second = client.get("/api/containers")
+
+        assert first.data == second.data
+        flask_app.mock_docker_service.get_all_containers.assert_called_once()
+
+        # Once the TTL has passed Docker is queried again
+        with patch(
+            "docker_monitor.time.monotonic",
+            return_value=100.0 + docker_monitor.LISTING_CACHE_TTL,
+        ):
+            client.get("/api/containers")
+        assert flask_app.mock_docker_service.get_all_containers.call_count == 2
+
+    def test_container_action_invalidates_listing_cache(self, client, flask_app):
+        """Test that a container action makes the next listing hit Docker."""
+        client.get("/api/containers")
+        client.post("/api/containers/test_container_id/stop")
+        client.get("/api/containers")
+        assert flask_app.mock_docker_service.get_all_containers.call_count == 2
+
+    def test_container_event_invalidates_listing_cache(self, client, flask_app):
+        """Test that a Docker container event makes the next listing hit Docker."""
+        client.get("/api/containers")
+        flask_app.app_instance._on_container_event("test_container_id", "stopped")
+        client.get("/api/containers")
+        assert flask_app.mock_docker_service.get_all_containers.call_count == 2
+
+    def test_get_containers_etag_not_modified(self, client, flask_app):
+        """Test that a matching If-None-Match header returns 304."""
+        response = client.get("/api/containers")
+        etag = response.headers["ETag"]
+        assert etag
+
+        response = client.get("/api/containers", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+
+    def test_get_containers_gzip(self, client, flask_app):
+        """Test that large listings are served gzipped to clients that accept it."""
+        containers, _ = flask_app.mock_docker_service.get_all_containers.return_value
+        flask_app.mock_docker_service.get_all_containers.return_value = (
+            containers * 50,
+            None,
+        )
+
+        plain = client.get("/api/containers")
+        assert "Content-Encoding" not in plain.headers
+
+        response = client.get("/api/containers", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == plain.data
+        assert response.headers["ETag"] != plain.headers["ETag"]
+
+    def test_get_containers_error_not_cached(self, client, flask_app):
+        """Test that failed listings are not cached."""
+        flask_app.mock_docker_service.get_all_containers.return_value = (
+            None,
+            "Docker unavailable",
+        )
+        response = client.get("/api/containers")
+        assert response.status_code == 400
+
+        client.get("/api/containers")
+        assert flask_app.mock_docker_service.get_all_containers.call_count == 2
+
+    def test_socketio_configuration(self):
+        """Test the options the Socket.IO server is created with."""
+        with (
+            patch("docker_monitor.SocketIO") as mock_socketio_class,
+            patch("docker_monitor.DockerService"),
+        ):
+            FlaskApp()
+
+        kwargs = mock_socketio_class.call_args.kwargs
+        assert kwargs["async_mode"] == "gevent"
+        assert kwargs["manage_session"] is False
+        assert kwargs["logger"] is False
+        assert kwargs["engineio_logger"] is False
+        assert kwargs["max_http_buffer_size"] == 1 << 20
+
+        packet_json = kwargs["json"]
+        payload = {"containers": [{"container_id": "abc", "state": "running"}]}
+        assert json.loads(packet_json.dumps(payload, separators=(",", ":"))) == payload
+        assert packet_json.loads('{"a":1}') == {"a": 1}
+
+    def test_get_flask_app_builds_one_instance(self):
+        """Test that FlaskApp is a plain class and the factory caches it."""
+        with (
+            patch("docker_monitor.SocketIO"),
+            patch("docker_monitor.DockerService"),
+        ):
+            assert FlaskApp() is not FlaskApp()
+
+            docker_monitor.get_flask_app.cache_clear()
+            try:
+                first = docker_monitor.get_flask_app()
+                assert docker_monitor.get_flask_app() is first
+            finally:
+                docker_monitor.get_flask_app.cache_clear()
+
+    def test_invalid_container_id_rejected(self, client, flask_app):
+        """Test that malformed container IDs never reach the Docker service."""
+        for path in [
+            "/api/containers/-bad/logs",
+            "/api/containers/bad%20id/logs",
+        ]:
+            response = client.get(path)
+            assert response.status_code == 400
+            assert json.loads(response.data)["error"] == "Invalid container id"
+
+        response = client.post("/api/containers/bad$id/start")
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"] == "Invalid container id"
+
+        flask_app.mock_docker_service.get_container_logs.assert_not_called()
+        flask_app.mock_docker_service.start_container.assert_not_called()
+
+    def test_invalid_image_id_rejected(self, client, flask_app):
+        """Test that malformed image IDs never reach the Docker service."""
+        response = client.delete("/api/images/bad%20image")
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"] == "Invalid image id"
+        flask_app.mock_docker_service.delete_image.assert_not_called()
+
     def test_get_container_logs(self, client, flask_app):
         """Test getting container logs."""
         response = client.get("/api/containers/test_container_id/logs")
@@ -159,6 +291,46 @@ class TestDockerMonitor:
             "test_container_id"
         )
 
+    def test_get_container_logs_streamed(self, client, flask_app):
+        """Test streaming container logs as plain text."""
+        flask_app.mock_docker_service.stream_container_logs.return_value = iter(
+            ["line 1\n", "line 2\n"]
+        )
+
+        response = client.get("/api/containers/test_container_id/logs?stream=1")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert response.get_data(as_text=True) == "line 1\nline 2\n"
+        flask_app.mock_docker_service.stream_container_logs.assert_called_once_with(
+            "test_container_id", follow=False, tail="all"
+        )
+        flask_app.mock_docker_service.get_container_logs.assert_not_called()
+
+    def test_get_container_logs_streamed_missing_container(self, client, flask_app):
+        """Test that streaming logs of a missing container returns a 404."""
+        containers = flask_app.mock_docker_service.client.containers
+        containers.get.side_effect = docker.errors.NotFound("No such container")
+
+        response = client.get("/api/containers/missing_container/logs?stream=1")
+
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["status"] == "error"
+        assert data["error"] == "Container missing_container not found"
+        flask_app.mock_docker_service.stream_container_logs.assert_not_called()
+
+    def test_get_container_logs_streamed_docker_error(self, client, flask_app):
+        """Test that a Docker failure before streaming logs returns a 500."""
+        containers = flask_app.mock_docker_service.client.containers
+        containers.get.side_effect = docker.errors.APIError("daemon unavailable")
+
+        response = client.get("/api/containers/test_container_id/logs?stream=1")
+
+        assert response.status_code == 500
+        assert "daemon unavailable" in json.loads(response.data)["error"]
+        flask_app.mock_docker_service.stream_container_logs.assert_not_called()
+
     def test_start_container(self, client, flask_app):
         """Test starting a container."""
         response = client.post("/api/containers/test_container_id/start")
@@ -214,13 +386,22 @@ class TestDockerMonitor:
             "test_container_id"
         )
 
-    def test_invalid_container_action(self, client):
+    def test_invalid_container_action(self, client, flask_app):
         """Test an invalid container action."""
         response = client.post("/api/containers/test_container_id/invalid_action")
-        assert response.status_code == 400
+        assert response.status_code == 404
         data = json.loads(response.data)
         assert data["status"] == "error"
-        assert "Invalid action" in data["error"]
+        flask_app.mock_docker_service.start_container.assert_not_called()
+        assert flask_app.app_instance._window_count == 0
+
+    def test_not_found_returns_json_error(self, client, flask_app):
+        """Test that unknown URLs get the standard JSON 404 body."""
+        response = client.get("/api/does-not-exist")
+        assert response.status_code == 404
+        assert response.mimetype == "application/json"
+        expected = flask_app.app_instance.error_response(NotFound.description, 404)
+        assert response.data == expected.data
 
     def test_get_images(self, client, flask_app):
         """Test getting all images."""
@@ -243,6 +424,14 @@ class TestDockerMonitor:
             "test_image_id", force=False
         )
 
+    def test_delete_image_force(self, client, flask_app):
+        """Test that the force flag accepts common truthy values."""
+        response = client.delete("/api/images/test_image_id?force=1")
+        assert response.status_code == 200
+        flask_app.mock_docker_service.delete_image.assert_called_once_with(
+            "test_image_id", force=True
+        )
+
     def test_error_case_containers(self, client, flask_app):
         """Test error handling for container endpoint."""
         flask_app.mock_docker_service.get_all_containers.return_value = (
@@ -351,6 +540,18 @@ class TestDockerMonitor:
             assert data["status"] == "success"
             assert data["data"] == {"test": "data"}
 
+    def test_success_response_serializes_datetimes(self, flask_app):
+        """Test that datetimes are serialized as ISO 8601 strings."""
+        with flask_app.app_context():
+            app_instance = FlaskApp()
+            response = app_instance.success_response(
+                {"created": datetime(2023, 1, 1, tzinfo=timezone.utc)}
+            )
+
+            assert response.mimetype == "application/json"
+            data = json.loads(response.get_data(as_text=True))
+            assert data["data"]["created"] == "2023-01-01T00:00:00+00:00"
+
     def test_websocket_connection_edge_cases(self, flask_app, mock_docker_service):
         """Test WebSocket connection with edge cases."""
         # Setup mocks
@@ -460,56 +661,51 @@ class TestDockerMonitor:
                 room="test-sid",
             )
 
-    def test_rate_limit_cleanup(self, client, flask_app):
-        """Test rate limit cleanup mechanism."""
-        # Set up a request count from 10 minutes ago
-        ten_minutes_ago = datetime.now() - timedelta(minutes=10)
-        flask_app.app_instance.request_counts = {ten_minutes_ago: 10}
-
-        # Add a current minute
-        current_minute = datetime.now().replace(second=0, microsecond=0)
-        flask_app.app_instance.request_counts[current_minute] = 5
-
-        # Define a cleanup function that mimics the actual implementation
-        def cleanup_old_request_counts():
-            five_minutes_ago = datetime.now() - timedelta(minutes=5)
-            keys_to_remove = [
-                k
-                for k in flask_app.app_instance.request_counts.keys()
-                if k < five_minutes_ago
-            ]
-            for key in keys_to_remove:
-                del flask_app.app_instance.request_counts[key]
+    def test_rate_limit_window_expiry(self, client, flask_app):
+        """Test that counts drop out of the window after 60 seconds."""
+        app_instance = flask_app.app_instance
+
+        with patch("docker_monitor.time.monotonic", return_value=600.0):
+            for _ in range(3):
+                assert app_instance.is_rate_limited() is False
+            assert app_instance._window_count == 3
 
-        # Run cleanup
-        cleanup_old_request_counts()
+        with patch("docker_monitor.time.monotonic", return_value=630.0):
+            assert app_instance.is_rate_limited() is False
+            assert app_instance._window_count == 4
 
-        # Verify old data was cleaned up
-        assert ten_minutes_ago not in flask_app.app_instance.request_counts
-        assert current_minute in flask_app.app_instance.request_counts
-        assert flask_app.app_instance.request_counts[current_minute] == 5
+        # The requests made at t=600 expire, the one made at t=630 remains
+        with patch("docker_monitor.time.monotonic", return_value=660.0):
+            assert app_instance.is_rate_limited() is False
+            assert app_instance._window_count == 2
 
     def test_rate_limit_exactly_at_limit(self, client, flask_app):
         """Test rate limit when exactly at the limit."""
-        # Set the rate limit
-        flask_app.app_instance.current_rate_limit = 10
-
-        # Set current count to be at the limit
-        current_minute = datetime.now().replace(second=0, microsecond=0)
-        flask_app.app_instance.request_counts = {current_minute: 10}
-
-        # Check if rate limited when at exactly the limit
-        def is_rate_limited():
-            count = flask_app.app_instance.request_counts.get(current_minute, 0)
-            # In the actual implementation, >= is used (at or over limit)
-            return count >= flask_app.app_instance.current_rate_limit
-
-        # At the limit - should be rate limited
-        assert is_rate_limited() is True
-
-        # Below the limit - should not be rate limited
-        flask_app.app_instance.request_counts[current_minute] = 9
-        assert is_rate_limited() is False
+        app_instance = flask_app.app_instance
+        app_instance.current_rate_limit = 10
+
+        with patch("docker_monitor.time.monotonic", return_value=600.0):
+            # Below the limit - should not be rate limited
+            for _ in range(10):
+                assert app_instance.is_rate_limited() is False
+
+            # At the limit - should be rate limited
+            assert app_instance.is_rate_limited() is True
+            assert app_instance._window_count == 10
+
+    def test_cors_preflight_skips_rate_limit(self, client, flask_app):
+        """Test that CORS preflights are answered without using rate-limit budget."""
+        response = client.options(
+            "/api/containers",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+        assert response.status_code == 200
+        assert "Access-Control-Allow-Origin" in response.headers
+        assert flask_app.app_instance._window_count == 0
+        flask_app.mock_docker_service.get_all_containers.assert_not_called()
 
     def test_handle_transport_error(self, flask_app):
         """Test handling of transport errors."""
@@ -1,11 +1,18 @@
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import docker
 import pytest
 
 # Import directly from the modules, not from backend package
-from docker_service import DockerService
+from docker_service import (
+    DOCKER_MAX_POOL_SIZE,
+    Container,
+    DockerService,
+    Image,
+    _parse_docker_time,
+)
 
 
 @pytest.fixture
@@ -21,6 +28,8 @@ def mock_docker_client():
     mock_container.image.tags = ["test_image:latest"]
     mock_container.status = "running"
     mock_container.attrs = {
+        "Id": "test_container_id",
+        "Image": "sha256:test_image_id",
         "State": {"Status": "running"},
         "Config": {
             "Labels": {
@@ -43,7 +52,11 @@ def mock_docker_client():
     }
 
     # Mock containers list
-    mock_client.containers.list.return_value = [mock_container]
+    mock_client.api.containers.return_value = [{"Id": "test_container_id"}]
+    mock_client.api.inspect_container.return_value = mock_container.attrs
+    mock_client.api.images.return_value = [
+        {"Id": "sha256:test_image_id", "RepoTags": ["test_image:latest"]}
+    ]
     mock_client.containers.get.return_value = mock_container
 
     # Mock image
@@ -62,7 +75,12 @@ def mock_docker_client():
 
     # Required for the rebuild test
     mock_client.images.pull.return_value = mock_image
-    mock_client.containers.run.return_value = mock_container
+    mock_client.api.create_container_from_config.return_value = {
+        "Id": "new_container_id"
+    }
+    mock_client.api.inspect_image.return_value = {
+        "Config": {"Cmd": ["serve"], "Env": ["PATH=/usr/bin"]}
+    }
 
     return mock_client
 
@@ -76,7 +94,8 @@ def docker_service(mock_docker_client):
         service.client = mock_docker_client
         # Mock the _emit_container_state method
         service._emit_container_state = Mock()
-        return service
+        yield service
+        service.close()
 
 
 class TestDockerService:
@@ -91,7 +110,10 @@ class TestDockerService:
             containers, error = docker_service.get_all_containers()
 
             # Verify we called the Docker API correctly
-            mock_docker_client.containers.list.assert_called_once_with(all=True)
+            mock_docker_client.api.containers.assert_called_once_with(all=True)
+            mock_docker_client.api.inspect_container.assert_called_once_with(
+                "test_container_id"
+            )
 
             # Verify we got the expected result
             assert error is None
@@ -108,6 +130,91 @@ class TestDockerService:
             assert container.compose_project == "Docker Compose: Test Project"
             assert container.compose_service == "test_service"
 
+    def test_get_all_containers_skips_removed_and_untagged(
+        self, docker_service, mock_docker_client
+    ):
+        """Test listing with a container that vanished and an untagged image."""
+        attrs = mock_docker_client.api.inspect_container.return_value
+        untagged = dict(attrs, Id="untagged_id", Name="/untagged", Image="sha256:bare")
+        mock_docker_client.api.containers.return_value = [
+            {"Id": "test_container_id"},
+            {"Id": "removed_id"},
+            {"Id": "untagged_id"},
+        ]
+        mock_docker_client.api.images.return_value = [
+            {"Id": "sha256:test_image_id", "RepoTags": ["test_image:latest"]},
+            {"Id": "sha256:bare", "RepoTags": ["<none>:<none>"]},
+        ]
+        inspected = {"test_container_id": attrs, "untagged_id": untagged}
+
+        def inspect(container_id):
+            if container_id not in inspected:
+                raise docker.errors.NotFound("No such container")
+            return inspected[container_id]
+
+        mock_docker_client.api.inspect_container.side_effect = inspect
+
+        containers, error = docker_service.get_all_containers()
+
+        assert error is None
+        assert [(c.id, c.name, c.image) for c in containers] == [
+            ("test_container_id", "test_container", "test_image:latest"),
+            ("untagged_id", "untagged", "sha256:bare"),
+        ]
+        mock_docker_client.api.images.assert_called_once_with()
+
+    def test_client_uses_larger_connection_pool(self, mock_docker_client):
+        """Test that the Docker client is created with a larger connection pool."""
+        with patch("docker.from_env", return_value=mock_docker_client) as from_env:
+            DockerService().close()
+        from_env.assert_called_once_with(max_pool_size=DOCKER_MAX_POOL_SIZE)
+
+    def test_close_releases_pool_and_client(self, docker_service, mock_docker_client):
+        """Test that close shuts down the worker pool and closes the client."""
+        docker_service.close()
+
+        mock_docker_client.close.assert_called_once_with()
+        with pytest.raises(RuntimeError):
+            docker_service._pool.submit(print)
+
+    def test_container_created_iso(self):
+        """Test that Container caches the ISO form of its creation time."""
+        created = datetime(2023, 1, 1, 12, 30)
+        container = Container(
+            id="abc",
+            name="test",
+            image="test:latest",
+            status="running",
+            state="running",
+            created=created,
+            ports="",
+        )
+        assert container.created_iso == created.isoformat()
+        # Slotted dataclass: no per-instance __dict__
+        assert not hasattr(container, "__dict__")
+
+    def test_parse_docker_time(self):
+        """Test parsing Docker API timestamps, including nanosecond fractions."""
+        parsed = _parse_docker_time("2023-01-01T12:30:00.123456789Z")
+        assert parsed == datetime(2023, 1, 1, 12, 30, 0, 123456, tzinfo=timezone.utc)
+        assert _parse_docker_time("2023-01-01T12:30:00").tzinfo is timezone.utc
+        assert _parse_docker_time("not a timestamp") is None
+        assert _parse_docker_time(1672576200) is None
+
+    def test_format_image_data_keeps_datetime(self, docker_service):
+        """Test that image creation times are left for orjson to serialize."""
+        created = datetime(2023, 1, 1, 12, 30)
+        image = Image(
+            id="sha256:abc",
+            tags=["test:latest"],
+            size=10,
+            created=created,
+            repo_digests=[],
+            parent_id="",
+            labels={},
+        )
+        assert docker_service.format_image_data([image])[0]["created"] is created
+
     def test_get_container_logs(self, docker_service, mock_docker_client):
         """Test the get_container_logs method returns container logs."""
         # Set up the mock container's logs method
@@ -231,6 +338,14 @@ class TestDockerService:
         assert "8080->80/tcp" in ports
         assert "8443->443/tcp" in ports
 
+        # Unpublished ports and empty binding lists are skipped
+        container_info["HostConfig"]["PortBindings"] = {
+            "80/tcp": [{"HostPort": ""}, {"HostPort": "8080"}],
+            "9000/tcp": None,
+        }
+        assert docker_service._format_ports(container_info) == "8080->80/tcp"
+        assert docker_service._format_ports({"HostConfig": None}) == ""
+
     def test_extract_compose_info(self, docker_service):
         """Test the _extract_compose_info helper method."""
         # Test labels from a Docker Compose project
@@ -252,12 +367,32 @@ class TestDockerService:
         assert project == "Standalone Containers"
         assert service == "unknown"
 
+        # Only the Compose labels are used, not the container name
+        labels_named = {"com.docker.compose.container-name": "my_app_web_1"}
+
+        project, service = docker_service._extract_compose_info(labels_named)
+
+        assert project == "Standalone Containers"
+        assert service == "unknown"
+
+        # A project without a service label
+        project, service = docker_service._extract_compose_info(
+            {"com.docker.compose.project": "my_app"}
+        )
+
+        assert project == "Docker Compose: My App"
+        assert service == "unknown"
+        assert docker_service._extract_compose_info(None) == (
+            "Standalone Containers",
+            "unknown",
+        )
+
     def test_error_handling_in_get_all_containers(
         self, docker_service, mock_docker_client
     ):
         """Test error handling in get_all_containers method."""
         # Make the list method raise an exception
-        mock_docker_client.containers.list.side_effect = Exception("Test error")
+        mock_docker_client.api.containers.side_effect = Exception("Test error")
 
         containers, error = docker_service.get_all_containers()
 
@@ -377,19 +512,144 @@ class TestDockerService:
         mock_container.stop.assert_called_once()
         mock_container.remove.assert_called_once()
         mock_docker_client.images.pull.assert_called_once_with("test_image:latest")
-        mock_docker_client.containers.run.assert_called_once()
-        docker_service._emit_container_state.assert_called()
+
+        # The new container is created from the inspected spec, leaving out
+        # values the image provides; without an image config all are kept
+        mock_docker_client.api.create_container_from_config.assert_called_once_with(
+            {
+                "Image": "test_image:latest",
+                "Env": ["TEST=value"],
+                "Labels": {"key": "value"},
+                "HostConfig": mock_container.attrs["HostConfig"],
+            },
+            name="test_container",
+        )
+        mock_docker_client.api.start.assert_called_once_with("new_container_id")
+        docker_service._emit_container_state.assert_called_once_with(
+            "new_container_id", "running"
+        )
 
         # Verify success
         assert success is True
         assert error is None
 
+    def test_rebuild_container_does_not_pin_image_defaults(
+        self, docker_service, mock_docker_client
+    ):
+        """Test that values inherited from the old image are left to the new one."""
+        mock_container = mock_docker_client.containers.get.return_value
+        mock_container.attrs["Config"] = {
+            "Image": "test_image:latest",
+            "Cmd": ["serve"],
+            "Entrypoint": ["/custom-entrypoint"],
+            "Env": ["PATH=/usr/bin", "TEST=value"],
+            "Labels": {"maintainer": "upstream", "key": "value"},
+        }
+        mock_docker_client.api.inspect_image.return_value = {
+            "Config": {
+                "Cmd": ["serve"],
+                "Entrypoint": None,
+                "Env": ["PATH=/usr/bin"],
+                "Labels": {"maintainer": "upstream"},
+            }
+        }
+
+        success, error = docker_service.rebuild_container("test_container_id")
+
+        assert success is True
+        assert error is None
+        api = mock_docker_client.api
+        api.inspect_image.assert_called_once_with("sha256:test_image_id")
+        create_config = api.create_container_from_config.call_args[0][0]
+        assert "Cmd" not in create_config
+        assert create_config["Entrypoint"] == ["/custom-entrypoint"]
+        assert create_config["Env"] == ["TEST=value"]
+        assert create_config["Labels"] == {"key": "value"}
+
+    def test_rebuild_container_restores_networks(
+        self, docker_service, mock_docker_client
+    ):
+        """Test that network attachments with aliases and addresses are kept."""
+        mock_container = mock_docker_client.containers.get.return_value
+        mock_container.attrs["HostConfig"] = {"NetworkMode": "app_net"}
+        mock_container.attrs["NetworkSettings"] = {
+            "Networks": {
+                "app_net": {
+                    "Aliases": ["web", "test_contain"],
+                    "IPAMConfig": {"IPv4Address": "172.20.0.5"},
+                },
+                "backend_net": {"Aliases": None, "IPAMConfig": None},
+            }
+        }
+        api = mock_docker_client.api
+
+        success, error = docker_service.rebuild_container("test_container_id")
+
+        assert success is True
+        assert error is None
+        api.create_endpoint_config.assert_called_once_with(
+            aliases=["web"],
+            ipv4_address="172.20.0.5",
+            ipv6_address=None,
+            link_local_ips=None,
+        )
+        api.create_networking_config.assert_called_once_with(
+            {"app_net": api.create_endpoint_config.return_value}
+        )
+        create_config = api.create_container_from_config.call_args[0][0]
+        assert (
+            create_config["NetworkingConfig"]
+            == api.create_networking_config.return_value
+        )
+        api.connect_container_to_network.assert_called_once_with(
+            "new_container_id",
+            "backend_net",
+            aliases=None,
+            ipv4_address=None,
+            ipv6_address=None,
+            link_local_ips=None,
+        )
+
+    def test_rebuild_container_pulls_while_stopping(
+        self, docker_service, mock_docker_client
+    ):
+        """Test that the image pull overlaps with stopping the old container."""
+        mock_container = mock_docker_client.containers.get.return_value
+        pull_started = threading.Event()
+        mock_docker_client.images.pull.side_effect = lambda image: pull_started.set()
+        # stop() records whether the pull began while it was waiting
+        seen_during_stop = []
+        mock_container.stop.side_effect = lambda: seen_during_stop.append(
+            pull_started.wait(timeout=2)
+        )
+
+        success, error = docker_service.rebuild_container("test_container_id")
+
+        assert success is True
+        assert error is None
+        assert seen_during_stop == [True]
+        mock_container.stop.assert_called_once()
+        mock_container.remove.assert_called_once()
+        mock_docker_client.api.start.assert_called_once_with("new_container_id")
+
+    def test_rebuild_container_pull_failure(self, docker_service, mock_docker_client):
+        """Test that a failed pull is reported as a rebuild failure."""
+        mock_docker_client.images.pull.side_effect = docker.errors.APIError(
+            "pull access denied"
+        )
+
+        success, error = docker_service.rebuild_container("test_container_id")
+
+        assert success is False
+        assert "pull access denied" in error
+        mock_docker_client.api.create_container_from_config.assert_not_called()
+
     def test_docker_api_timeout_handling(self, docker_service, mock_docker_client):
         """Test handling of Docker API timeouts."""
         # Configure mock to time out
         import requests
 
-        mock_docker_client.containers.list.side_effect = (
+        mock_docker_client.api.containers.side_effect = (
             requests.exceptions.ReadTimeout("Connection timed out")
         )
 
@@ -438,7 +698,7 @@ class TestDockerService:
             ("stop", "stop_container", "stopping"),
             ("restart", "restart_container", "restarting"),
             ("delete", "delete_container", "deleted"),
-            ("rebuild", "rebuild_container", "stopped"),
+            ("rebuild", "rebuild_container", "running"),
         ],
     )
     def test_container_actions_parameterized(
@@ -450,9 +710,6 @@ class TestDockerService:
         expected_state,
     ):
         """Test different container actions using parameterization."""
-        # Set up the mock container
-        mock_container = mock_docker_client.containers.get.return_value
-
         # Don't try to mock the method, just call it and verify results
         method = getattr(docker_service, expected_method)
         success, error = method("test_container_id")
@@ -464,16 +721,12 @@ class TestDockerService:
         # Verify Docker client was called properly
         mock_docker_client.containers.get.assert_called_with("test_container_id")
 
-        # For rebuild, expect two emits: 'stopped' and 'running'. For others, only one emit.
+        # Rebuild only emits the replacement's state; the stop of the old
+        # container reaches clients through the Docker events subscription
         if expected_method == "rebuild_container":
-            calls = [
-                (("test_container_id", "stopped"),),
-                ((mock_container.id, "running"),),
-            ]
-            actual_calls = docker_service._emit_container_state.call_args_list
-            assert len(actual_calls) == 2
-            assert actual_calls[0][0] == ("test_container_id", "stopped")
-            assert actual_calls[1][0] == (mock_container.id, "running")
+            docker_service._emit_container_state.assert_called_once_with(
+                "new_container_id", expected_state
+            )
         else:
             docker_service._emit_container_state.assert_called_once_with(
                 "test_container_id", expected_state
@@ -544,6 +797,25 @@ class TestDockerService:
         assert len(logs) == 1
         assert "Log with since param" in logs[0]
 
+    def test_stream_container_logs_without_follow(
+        self, docker_service, mock_docker_client
+    ):
+        """Test reading the complete log once without following it."""
+        mock_container = Mock()
+        mock_docker_client.containers.get.return_value = mock_container
+        mock_container.logs.return_value = iter([b"line 1\n", b"line 2\n"])
+
+        logs = list(
+            docker_service.stream_container_logs(
+                "test_container_id", follow=False, tail="all"
+            )
+        )
+
+        assert logs == ["line 1\n", "line 2\n"]
+        call_kwargs = mock_container.logs.call_args[1]
+        assert call_kwargs.get("follow") is False
+        assert call_kwargs.get("tail") == "all"
+
     def test_stream_container_logs_not_found(self, docker_service, mock_docker_client):
         """Test container log streaming when container is not found."""
         # Simulate container not found
@@ -773,6 +1045,22 @@ class TestDockerService:
             "test_container_id", "running"
         )
 
+    def test_container_event_listeners_run_before_emit(self, docker_service):
+        """Test that event listeners are notified before clients are."""
+        calls = []
+        docker_service.add_container_event_listener(
+            lambda container_id, state: calls.append(("listener", container_id, state))
+        )
+        docker_service._emit_container_state.side_effect = (
+            lambda container_id, state: calls.append(("emit", container_id, state))
+        )
+
+        docker_service._handle_container_event(
+            {"Type": "container", "status": "die", "Actor": {"ID": "abc"}}
+        )
+
+        assert calls == [("listener", "abc", "stopped"), ("emit", "abc", "stopped")]
+
     def test_subscribe_to_docker_events(self, docker_service, mock_docker_client):
         """Test the subscribe_to_docker_events method."""
         # Directly check the events method is called
@@ -359,6 +359,122 @@ class TestLoggingUtils(unittest.TestCase):
                         "Root logger should have a StreamHandler",
                     )
 
+    def test_setup_logging_does_not_stack_filters(self):
+        """Test that calling setup_logging twice attaches each filter once."""
+        from backend.logging_utils import RequestIdFilter as RealRequestIdFilter
+        from backend.logging_utils import SocketErrorFilter
+        from backend.logging_utils import setup_logging as real_setup_logging
+
+        logger_names = [
+            None,
+            "docker_service",
+            "docker_monitor",
+            "engineio.server",
+            "socketio.server",
+        ]
+        saved_state = {
+            name: (
+                logging.getLogger(name).handlers[:],
+                logging.getLogger(name).filters[:],
+                logging.getLogger(name).level,
+                logging.getLogger(name).propagate,
+            )
+            for name in logger_names
+        }
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                log_path = os.path.join(temp_dir, "app.log")
+                real_setup_logging(log_level="INFO", log_file=log_path)
+                real_setup_logging(log_level="INFO", log_file=log_path)
+
+                for name in ["docker_monitor", "socketio.server"]:
+                    filters = logging.getLogger(name).filters
+                    self.assertEqual(
+                        sum(isinstance(f, RealRequestIdFilter) for f in filters), 1
+                    )
+                root_filters = logging.getLogger().filters
+                self.assertEqual(
+                    sum(isinstance(f, SocketErrorFilter) for f in root_filters), 1
+                )
+
+                for name in logger_names:
+                    for handler in logging.getLogger(name).handlers:
+                        handler.close()
+        finally:
+            for name, (handlers, filters, level, propagate) in saved_state.items():
+                logger = logging.getLogger(name)
+                logger.handlers[:] = handlers
+                logger.filters[:] = filters
+                logger.setLevel(level)
+                logger.propagate = propagate
+
+    def test_generated_request_ids_are_unique(self):
+        """Test that generated request IDs are unique and carry the pid."""
+        from backend.logging_utils import set_request_id as real_set_request_id
+
+        request_ids = {real_set_request_id() for _ in range(1000)}
+        self.assertEqual(len(request_ids), 1000)
+        for request_id in request_ids:
+            self.assertTrue(request_id.startswith(f"{os.getpid():x}-"))
+
+    def test_rate_limited_logger_caps_records_per_event(self):
+        """Test that RateLimitedLogger drops an event's records past its budget."""
+        from backend.logging_utils import RateLimitedLogger
+
+        test_logger = logging.getLogger("test_rate_limited_logger")
+        test_logger.setLevel(logging.DEBUG)
+        test_logger.propagate = False
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        test_logger.addHandler(handler)
+
+        try:
+            limited = RateLimitedLogger(test_logger, per_second=3)
+            with patch("backend.logging_utils.time.monotonic", return_value=100.0):
+                for _ in range(5):
+                    limited.debug("connect", extra={"event": "websocket_connect"})
+                limited.info("other", extra={"event": "other_event"})
+                limited.info("no event")
+            self.assertEqual(len(records), 5)
+            self.assertEqual(records[0].funcName, self._testMethodName)
+
+            # The budget resets in the next second
+            with patch("backend.logging_utils.time.monotonic", return_value=101.0):
+                limited.debug("connect", extra={"event": "websocket_connect"})
+            self.assertEqual(len(records), 6)
+        finally:
+            test_logger.removeHandler(handler)
+
+    def test_emit_sets_event_fields_when_enabled(self):
+        """Test that emit() stores the event and fields and skips disabled levels."""
+        from backend.logging_utils import emit
+
+        test_logger = logging.getLogger("test_emit")
+        test_logger.setLevel(logging.INFO)
+        test_logger.propagate = False
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        test_logger.addHandler(handler)
+
+        try:
+            emit(test_logger, logging.DEBUG, "skipped", "not logged")
+            emit(test_logger, logging.INFO, "first", "Deleted %s", "abc", count=2)
+            emit(test_logger, logging.INFO, "second", "Done")
+
+            self.assertEqual(len(records), 2)
+            self.assertEqual(records[0].event, "first")
+            self.assertEqual(records[0].getMessage(), "Deleted abc")
+            self.assertEqual(records[0].count, 2)
+            self.assertEqual(records[0].funcName, self._testMethodName)
+            # Fields from one call do not leak into the next
+            self.assertEqual(records[1].event, "second")
+            self.assertFalse(hasattr(records[1], "count"))
+        finally:
+            test_logger.removeHandler(handler)
+
 
 if __name__ == "__main__":
     unittest.main()
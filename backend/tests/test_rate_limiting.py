@@ -1,6 +1,7 @@
 import json
+import time
 import unittest
-from datetime import datetime, timedelta, timezone
+from array import array
 from unittest.mock import MagicMock, patch
 
 
@@ -61,8 +62,18 @@ class TestRateLimiting(unittest.TestCase):
         # Set up the rate limit
         self.app_instance.current_rate_limit = 10
 
-        # Clear request counts
-        self.app_instance.request_counts = {}
+        # Reset the rate limiting window
+        self.reset_window(int(time.monotonic()))
+
+    def reset_window(self, now):
+        self.app_instance._second_buckets = array("i", [0] * 60)
+        self.app_instance._last_second = now
+        self.app_instance._window_count = 0
+
+    def fill_window(self, now, count):
+        self.reset_window(now)
+        self.app_instance._second_buckets[now % 60] = count
+        self.app_instance._window_count = count
 
     def test_rate_limit_not_exceeded(self):
         # Make a request that should succeed
@@ -71,17 +82,16 @@ class TestRateLimiting(unittest.TestCase):
         # Check response
         self.assertEqual(response.status_code, 200)
 
-        # Verify a count was recorded
-        current_minute = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-        self.assertIn(current_minute, self.app_instance.request_counts)
-        self.assertEqual(self.app_instance.request_counts[current_minute], 1)
+        # Verify a count was recorded for the current second
+        now = self.app_instance._last_second
+        self.assertEqual(self.app_instance._second_buckets[now % 60], 1)
+        self.assertEqual(self.app_instance._window_count, 1)
 
     def test_rate_limit_exceeded(self):
         # Set up a situation where rate limit is exceeded
-        current_minute = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-        self.app_instance.request_counts = {
-            current_minute: self.app_instance.current_rate_limit
-        }
+        self.fill_window(
+            int(time.monotonic()), self.app_instance.current_rate_limit
+        )
 
         # Make a request that should be rate limited
         response = self.client.get("/api/containers")
@@ -94,28 +104,10 @@ class TestRateLimiting(unittest.TestCase):
         self.assertEqual(data["status"], "error")
         self.assertIn("Rate limit exceeded", data["error"])
 
-    def test_rate_limit_cleanup(self):
-        # Set up old request counts (more than 2 minutes ago)
-        now = datetime.now(timezone.utc)
-        current_minute = now.replace(second=0, microsecond=0)
-        # Use timedelta for proper datetime arithmetic
-        old_minute = current_minute - timedelta(minutes=3)
-
-        # Add counts for both current and old minute
-        self.app_instance.request_counts = {current_minute: 5, old_minute: 8}
-
-        # Make a request to trigger cleanup
-        response = self.client.get("/api/containers")
-
-        # Verify response was successful
-        self.assertEqual(response.status_code, 200)
-
-        # Check that old entries were cleaned up
-        self.assertNotIn(old_minute, self.app_instance.request_counts)
-        self.assertIn(current_minute, self.app_instance.request_counts)
+        # Rejected requests are not counted
         self.assertEqual(
-            self.app_instance.request_counts[current_minute], 6
-        )  # 5 + 1 from this request
+            self.app_instance._window_count, self.app_instance.current_rate_limit
+        )
 
     def test_multiple_requests_increment_counter(self):
         # Make multiple requests
@@ -124,8 +116,8 @@ class TestRateLimiting(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
 
         # Check that counter was incremented correctly
-        current_minute = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-        self.assertEqual(self.app_instance.request_counts[current_minute], 5)
+        self.assertEqual(self.app_instance._window_count, 5)
+        self.assertEqual(sum(self.app_instance._second_buckets), 5)
 
     def test_rate_limit_different_endpoints(self):
         # Make requests to different endpoints
@@ -140,32 +132,48 @@ class TestRateLimiting(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
 
         # Check that all requests counted toward the same limit
-        current_minute = datetime.now(timezone.utc).replace(second=0, microsecond=0)
-        self.assertEqual(self.app_instance.request_counts[current_minute], 3)
-
-    def test_rate_limit_reset_after_minute_change(self):
-        # Set up counts for previous minute
-        now = datetime.now(timezone.utc)
-        current_minute = now.replace(second=0, microsecond=0)
-        # Use timedelta for proper datetime arithmetic
-        previous_minute = current_minute - timedelta(minutes=1)
-
-        self.app_instance.request_counts = {
-            previous_minute: self.app_instance.current_rate_limit
-        }
+        self.assertEqual(self.app_instance._window_count, 3)
+
+    @patch("backend.docker_monitor.time.monotonic")
+    def test_rate_limit_sliding_window(self, mock_monotonic):
+        # Use up the limit at t=100
+        self.fill_window(100, self.app_instance.current_rate_limit)
 
-        # Make a request in the current minute
+        # Still inside the 60 second window
+        mock_monotonic.return_value = 159.5
         response = self.client.get("/api/containers")
+        self.assertEqual(response.status_code, 429)
 
-        # Check that request succeeded (rate limit applies per minute)
+        # Once the bucket for t=100 leaves the window requests are allowed again
+        mock_monotonic.return_value = 160.0
+        response = self.client.get("/api/containers")
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.app_instance._window_count, 1)
+        self.assertEqual(self.app_instance._second_buckets[100 % 60], 1)
 
-        # Verify counts for both minutes
-        self.assertEqual(
-            self.app_instance.request_counts[previous_minute],
-            self.app_instance.current_rate_limit,
-        )
-        self.assertEqual(self.app_instance.request_counts[current_minute], 1)
+    @patch("backend.docker_monitor.time.monotonic")
+    def test_rate_limit_reset_after_idle_period(self, mock_monotonic):
+        # Use up the limit at t=100
+        self.fill_window(100, self.app_instance.current_rate_limit)
+
+        # Make a request long after the window has passed
+        mock_monotonic.return_value = 1000.0
+        response = self.client.get("/api/containers")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.app_instance._window_count, 1)
+        self.assertEqual(sum(self.app_instance._second_buckets), 1)
+
+    @patch("backend.docker_monitor.time.monotonic")
+    def test_rate_limit_ignores_wall_clock(self, mock_monotonic):
+        # The window only depends on the monotonic clock
+        mock_monotonic.return_value = 100.0
+        self.fill_window(100, self.app_instance.current_rate_limit)
+
+        with patch("backend.docker_monitor.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = AssertionError("wall clock used")
+            response = self.client.get("/api/containers")
+
+        self.assertEqual(response.status_code, 429)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
@@ -38,10 +40,6 @@ class TestWebSocketHandlers(unittest.TestCase):
         self.mock_docker_service = MagicMock()
         mock_docker_service.return_value = self.mock_docker_service
 
-        # Reset FlaskApp singleton to ensure clean tests
-        FlaskApp._instance = None
-        FlaskApp._routes_registered = False
-
         # Create app instance
         self.app_instance = FlaskApp(socketio=self.mock_socketio)
         self.app_instance.docker_service = self.mock_docker_service
@@ -77,6 +75,7 @@ class TestWebSocketHandlers(unittest.TestCase):
         self.mock_container.status = "running"
         self.mock_container.state = "running"
         self.mock_container.created = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        self.mock_container.created_iso = self.mock_container.created.isoformat()
         self.mock_container.ports = "8080->80/tcp"
         self.mock_container.compose_project = "test_project"
         self.mock_container.compose_service = "test_service"
@@ -136,6 +135,57 @@ class TestWebSocketHandlers(unittest.TestCase):
             room="test-sid",
         )
 
+    def test_websocket_connect_reuses_recent_listing(self):
+        self.mock_docker_service.get_all_containers.return_value = (
+            [self.mock_container],
+            None,
+        )
+
+        # The listing endpoint and a connect right after it share one fetch
+        self.app_instance._load_containers()
+        self.socket_handlers["connect"]()
+
+        self.mock_docker_service.get_all_containers.assert_called_once()
+
+    def test_concurrent_connects_share_one_container_fetch(self):
+        def slow_fetch():
+            time.sleep(0.05)
+            return [self.mock_container], None
+
+        self.mock_docker_service.get_all_containers.side_effect = slow_fetch
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.app_instance._fetch_containers())
+            )
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 3)
+        self.mock_docker_service.get_all_containers.assert_called_once()
+
+    def test_websocket_connect_reuses_initial_state_payload(self):
+        self.mock_docker_service.get_all_containers.return_value = (
+            [self.mock_container],
+            None,
+        )
+
+        self.socket_handlers["connect"]()
+        self.socket_handlers["connect"]()
+
+        payloads = [
+            call[0][1]["containers"]
+            for call in self.mock_socketio.emit.call_args_list
+            if call[0][0] == "initial_state"
+        ]
+        self.assertEqual(len(payloads), 2)
+        self.assertIs(payloads[0], payloads[1])
+
     def test_websocket_log_stream(self):
         # Setup mock container logs
         self.mock_docker_service.get_container_logs.return_value = (
@@ -149,12 +199,8 @@ class TestWebSocketHandlers(unittest.TestCase):
             "Log line 2",
         ]
 
-        # Mock socketio server manager rooms
-        self.mock_socketio.server = MagicMock()
-        self.mock_socketio.server.manager.rooms = {"/": {"test-sid": True}}
-
-        # Mock eventlet.spawn to execute the function immediately instead of in background
-        with patch("backend.docker_monitor.eventlet.spawn", lambda f: f()):
+        # Run the background task immediately instead of in a greenlet
+        with patch.object(self.mock_socketio, "start_background_task", lambda f: f()):
             # Reset the mocks
             self.mock_socketio.emit.reset_mock()
             self.mock_docker_service.get_container_logs.reset_mock()
@@ -186,13 +232,12 @@ class TestWebSocketHandlers(unittest.TestCase):
                 room="test-sid",
             )
 
-            # Verify streamed log lines were emitted to client
-            for log_line in ["Log line 1", "Log line 2"]:
-                self.mock_socketio.emit.assert_any_call(
-                    "log_update",
-                    {"container_id": "test_container", "log": log_line},
-                    room="test-sid",
-                )
+            # Verify streamed log lines were emitted to client as a batch
+            self.mock_socketio.emit.assert_any_call(
+                "log_update_batch",
+                {"container_id": "test_container", "logs": ["Log line 1", "Log line 2"]},
+                room="test-sid",
+            )
 
     def test_websocket_log_stream_missing_container_id(self):
         # Reset the mocks
@@ -212,6 +257,16 @@ class TestWebSocketHandlers(unittest.TestCase):
             "error", {"error": "Container ID is required"}, room="test-sid"
         )
 
+    def test_websocket_log_stream_invalid_container_id(self):
+        self.mock_socketio.emit.reset_mock()
+
+        self.socket_handlers["start_log_stream"]({"container_id": "../etc"})
+
+        self.mock_socketio.emit.assert_any_call(
+            "error", {"error": "Invalid container id"}, room="test-sid"
+        )
+        self.mock_docker_service.get_container_logs.assert_not_called()
+
     def test_websocket_disconnect(self):
         # Reset the mock to clear previous calls
         self.mock_socketio.on.reset_mock()
@@ -281,15 +336,11 @@ class TestWebSocketHandlers(unittest.TestCase):
         self.mock_docker_service.get_container_logs.return_value = ("Initial logs", None)
         self.mock_docker_service.stream_container_logs.return_value = ["Log line 1"]
         
-        # Mock socketio server manager rooms
-        self.mock_socketio.server = MagicMock()
-        self.mock_socketio.server.manager.rooms = {"/": {"test-sid": True}}
-        
         # Start log stream first
         start_log_stream_handler = self.socket_handlers.get("start_log_stream")
         self.assertIsNotNone(start_log_stream_handler)
         
-        with patch("backend.docker_monitor.eventlet.spawn") as mock_spawn:
+        with patch.object(self.mock_socketio, "start_background_task") as mock_spawn:
             # Mock the spawned function to run immediately
             mock_spawn.side_effect = lambda f: f()
             
@@ -313,6 +364,31 @@ class TestWebSocketHandlers(unittest.TestCase):
         # (In real implementation, this would stop the background stream)
         # For now, just verify the handler can be called without errors
 
+    def test_websocket_log_stream_stops_on_disconnect(self):
+        """Test that disconnecting stops the client's running log streams."""
+        self.mock_docker_service.get_container_logs.return_value = ("", None)
+        disconnect_handler = self.socket_handlers.get("disconnect")
+        self.assertIsNotNone(disconnect_handler)
+
+        def log_lines():
+            yield "Line 1\n"
+            disconnect_handler("client disconnect")
+            yield "Line 2\n"
+
+        self.mock_docker_service.stream_container_logs.return_value = log_lines()
+
+        with patch.object(self.mock_socketio, "start_background_task", lambda f: f()):
+            self.socket_handlers["start_log_stream"]({"container_id": "test_container"})
+
+        emitted_logs = [
+            log
+            for c in self.mock_socketio.emit.call_args_list
+            if c[0][0] == "log_update_batch"
+            for log in c[0][1]["logs"]
+        ]
+        self.assertNotIn("Line 2\n", emitted_logs)
+        self.assertEqual(self.app_instance.active_streams, {})
+
     def test_websocket_log_stream_concurrent_containers(self):
         """Test handling multiple concurrent log streams."""
         container_ids = ["container1", "container2", "container3"]
@@ -321,14 +397,10 @@ class TestWebSocketHandlers(unittest.TestCase):
         self.mock_docker_service.get_container_logs.return_value = ("Initial logs", None)
         self.mock_docker_service.stream_container_logs.return_value = ["Log line"]
         
-        # Mock socketio server manager rooms
-        self.mock_socketio.server = MagicMock()
-        self.mock_socketio.server.manager.rooms = {"/": {"test-sid": True}}
-        
         start_log_stream_handler = self.socket_handlers.get("start_log_stream")
         self.assertIsNotNone(start_log_stream_handler)
         
-        with patch("backend.docker_monitor.eventlet.spawn") as mock_spawn:
+        with patch.object(self.mock_socketio, "start_background_task") as mock_spawn:
             mock_spawn.side_effect = lambda f: f()
             
             # Start log streams for multiple containers
@@ -372,14 +444,10 @@ class TestWebSocketHandlers(unittest.TestCase):
         self.mock_docker_service.get_container_logs.return_value = ("", None)
         self.mock_docker_service.stream_container_logs.return_value = log_updates
         
-        # Mock socketio server manager rooms
-        self.mock_socketio.server = MagicMock()
-        self.mock_socketio.server.manager.rooms = {"/": {"test-sid": True}}
-        
         start_log_stream_handler = self.socket_handlers.get("start_log_stream")
         self.assertIsNotNone(start_log_stream_handler)
         
-        with patch("backend.docker_monitor.eventlet.spawn") as mock_spawn:
+        with patch.object(self.mock_socketio, "start_background_task") as mock_spawn:
             mock_spawn.side_effect = lambda f: f()
             
             # Reset mock
@@ -388,20 +456,144 @@ class TestWebSocketHandlers(unittest.TestCase):
             # Start log stream
             start_log_stream_handler({"container_id": "buffer_test_container"})
             
-            # Verify each log line was emitted separately
-            for log_line in log_updates:
-                self.mock_socketio.emit.assert_any_call(
-                    "log_update",
-                    {"container_id": "buffer_test_container", "log": log_line},
-                    room="test-sid",
-                )
-            
-            # Verify the correct number of emit calls (initial empty logs + 3 updates = 4 total)
+            # Verify lines that arrived together were emitted in one batch
+            self.mock_socketio.emit.assert_any_call(
+                "log_update_batch",
+                {"container_id": "buffer_test_container", "logs": log_updates},
+                room="test-sid",
+            )
+
+            # Only the initial logs use the single log_update event
             log_update_calls = [
                 call for call in self.mock_socketio.emit.call_args_list
                 if call[0][0] == "log_update"
             ]
-            self.assertEqual(len(log_update_calls), 4)
+            self.assertEqual(len(log_update_calls), 1)
+
+    def test_websocket_log_stream_batch_size_limit(self):
+        """Test that large bursts of log lines are split into bounded batches."""
+        log_lines = [f"Line {i}\n" for i in range(40)]
+        self.mock_docker_service.get_container_logs.return_value = ("", None)
+        self.mock_docker_service.stream_container_logs.return_value = log_lines
+
+        with patch.object(self.mock_socketio, "start_background_task", lambda f: f()):
+            self.mock_socketio.emit.reset_mock()
+            self.socket_handlers["start_log_stream"]({"container_id": "busy_container"})
+
+        batches = [
+            call[0][1]["logs"]
+            for call in self.mock_socketio.emit.call_args_list
+            if call[0][0] == "log_update_batch"
+        ]
+        self.assertEqual(batches, [log_lines[:32], log_lines[32:]])
+
+    def test_log_batches_coalesce_lines_arriving_close_together(self):
+        """Test that lines trickling in within the batch delay share a batch."""
+
+        def trickle():
+            for i in range(3):
+                time.sleep(0.005)
+                yield f"Line {i}\n"
+
+        def start_thread(f):
+            thread = threading.Thread(target=f, daemon=True)
+            thread.start()
+            return thread
+
+        with patch.object(self.mock_socketio, "start_background_task", start_thread):
+            batches = list(
+                self.app_instance._iter_log_batches(trickle(), threading.Event())
+            )
+
+        self.assertEqual(batches, [["Line 0\n", "Line 1\n", "Line 2\n"]])
+
+    def test_log_batches_reader_waits_for_consumer(self):
+        """Test that a full queue holds the reader back until the consumer stops."""
+        produced = []
+
+        def endless():
+            while True:
+                produced.append(len(produced))
+                yield f"Line {len(produced)}\n"
+
+        reader = None
+
+        def start_thread(f):
+            nonlocal reader
+            reader = threading.Thread(target=f, daemon=True)
+            reader.start()
+            return reader
+
+        with patch("backend.docker_monitor.LOG_QUEUE_MAX_LINES", 4), patch.object(
+            self.mock_socketio, "start_background_task", start_thread
+        ):
+            batches = self.app_instance._iter_log_batches(endless(), threading.Event())
+            next(batches)
+            time.sleep(0.1)
+            # One full batch taken, the queue refilled, one line waiting to be put
+            self.assertLessEqual(len(produced), 32 + 4 + 1)
+            batches.close()
+
+        reader.join(timeout=1)
+        self.assertFalse(reader.is_alive())
+
+    def test_log_batches_end_when_stopped_while_waiting(self):
+        """Test that setting the stop event ends a consumer waiting for lines."""
+        release = threading.Event()
+
+        def stalled():
+            yield "Line 1\n"
+            release.wait(timeout=1)
+            yield "Line 2\n"
+
+        def start_thread(f):
+            thread = threading.Thread(target=f, daemon=True)
+            thread.start()
+            return thread
+
+        stop_event = threading.Event()
+        batches = []
+        with patch.object(self.mock_socketio, "start_background_task", start_thread):
+            consumer = threading.Thread(
+                target=lambda: batches.extend(
+                    self.app_instance._iter_log_batches(stalled(), stop_event)
+                ),
+                daemon=True,
+            )
+            consumer.start()
+            time.sleep(0.1)
+            stop_event.set()
+            release.set()
+            consumer.join(timeout=1)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(batches, [["Line 1\n"]])
+
+    def test_websocket_log_stream_generator_error(self):
+        """Test that lines read before a stream error are sent before the error."""
+        self.mock_docker_service.get_container_logs.return_value = ("", None)
+
+        def failing_stream():
+            yield "Line 1\n"
+            raise Exception("Stream broken")
+
+        self.mock_docker_service.stream_container_logs.return_value = failing_stream()
+
+        with patch.object(self.mock_socketio, "start_background_task", lambda f: f()):
+            self.mock_socketio.emit.reset_mock()
+            self.socket_handlers["start_log_stream"]({"container_id": "test_container"})
+
+        self.mock_socketio.emit.assert_any_call(
+            "log_update_batch",
+            {"container_id": "test_container", "logs": ["Line 1\n"]},
+            room="test-sid",
+        )
+        self.mock_socketio.emit.assert_any_call(
+            "error",
+            {"error": "Error streaming logs: Stream broken"},
+            room="test-sid",
+        )
+        self.assertEqual(self.app_instance.active_streams, {})
 
 
 if __name__ == "__main__":
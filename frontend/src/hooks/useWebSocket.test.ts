@@ -288,6 +288,38 @@ describe('useWebSocket', () => {
             expect(onLogUpdate).toHaveBeenCalledTimes(1);
             expect(onLogUpdate).toHaveBeenCalledWith('container1', 'line 1\nline 2\nline 3\n');
         });
+
+        it('should buffer batched log updates together with single updates', () => {
+            const onLogUpdate = jest.fn();
+            const { result } = renderHook(() => useWebSocket({
+                onLogUpdate,
+                logFlushDelay: 200
+            }));
+
+            act(() => {
+                result.current.startLogStream('container1');
+            });
+
+            act(() => {
+                eventHandlers['log_update']({
+                    container_id: 'container1',
+                    log: 'initial\n'
+                });
+                eventHandlers['log_update_batch']({
+                    container_id: 'container1',
+                    logs: ['line 1\n', 'line 2\n']
+                });
+            });
+
+            expect(onLogUpdate).not.toHaveBeenCalled();
+
+            act(() => {
+                jest.advanceTimersByTime(200);
+            });
+
+            expect(onLogUpdate).toHaveBeenCalledTimes(1);
+            expect(onLogUpdate).toHaveBeenCalledWith('container1', 'initial\nline 1\nline 2\n');
+        });
     });
 
     describe('WebSocket connection management', () => {
@@ -64,6 +64,67 @@ const clearContainerTimeout = (containerId: string): void => {
     }
 };
 
+// Append log text to a container's buffer and schedule a flush to the handlers
+const bufferLogUpdate = (containerId: string, log: string): void => {
+    const logBuffer = logBuffers.get(containerId) || '';
+    const newBuffer = logBuffer + log;
+    logBuffers.set(containerId, newBuffer);
+
+    if (!pendingFlushes.has(containerId)) {
+        // Clear any existing timeout for this container before creating a new one
+        clearContainerTimeout(containerId);
+        
+        pendingFlushes.add(containerId);
+        // Find a logFlushDelay from any handler, fallback to 200ms
+        let logFlushDelay = 200;
+        for (const handler of globalHandlers) {
+            if (handler.logFlushDelay !== undefined) {
+                logFlushDelay = handler.logFlushDelay;
+                break;
+            }
+        }
+        // Use setTimeout safely - handle test environment
+        let timeoutFn: typeof setTimeout;
+        if (typeof setTimeout !== 'undefined') {
+            timeoutFn = setTimeout;
+        } else if (typeof global !== 'undefined' && global.setTimeout) {
+            timeoutFn = global.setTimeout;
+        } else if (typeof window !== 'undefined' && window.setTimeout) {
+            timeoutFn = window.setTimeout;
+        } else {
+            // Fallback for test environment - create a simple mock
+            timeoutFn = ((fn: () => void, ms: number) => {
+                return setTimeout(fn, ms);
+            }) as typeof setTimeout;
+        }
+        
+        const timeoutId = timeoutFn(() => {
+            const bufferToFlush = logBuffers.get(containerId) || '';
+            if (bufferToFlush.length > 0) {
+                logBuffers.set(containerId, ''); // Clear buffer for this container
+                logger.debug('Flushing log buffer:', {
+                    containerId,
+                    bufferLength: bufferToFlush.length,
+                    lineCount: (bufferToFlush.match(/\n/g) || []).length + 1
+                });
+                globalHandlers.forEach(handler => {
+                    if (handler.onLogUpdate) {
+                        try {
+                            handler.onLogUpdate(containerId, bufferToFlush);
+                        } catch (error: any) {
+                            logger.error('Error in log update handler:', error instanceof Error ? error : new Error(String(error)));
+                        }
+                    }
+                });
+            }
+            // Clean up after timeout completion
+            pendingFlushes.delete(containerId);
+            activeTimeouts.delete(containerId);
+        }, logFlushDelay);
+        activeTimeouts.set(containerId, timeoutId); // Store the timeout ID
+    }
+};
+
 const initializeSocket = () => {
     if (globalSocket || isInitializing) return;
 
@@ -146,64 +207,17 @@ const initializeSocket = () => {
                 logSample: data.log.substring(0, 50) + (data.log.length > 50 ? '...' : '')
             });
 
-            const containerId = data.container_id;
-            const logBuffer = logBuffers.get(containerId) || '';
-            const newBuffer = logBuffer + data.log;
-            logBuffers.set(containerId, newBuffer);
+            bufferLogUpdate(data.container_id, data.log);
+        });
+
+        // Streamed log lines arrive in batches
+        globalSocket.on('log_update_batch', (data: { container_id: string; logs: string[] }) => {
+            logger.debug('Received log update batch:', {
+                containerId: data.container_id,
+                lineCount: data.logs.length
+            });
 
-            if (!pendingFlushes.has(containerId)) {
-                // Clear any existing timeout for this container before creating a new one
-                clearContainerTimeout(containerId);
-                
-                pendingFlushes.add(containerId);
-                // Find a logFlushDelay from any handler, fallback to 200ms
-                let logFlushDelay = 200;
-                for (const handler of globalHandlers) {
-                    if (handler.logFlushDelay !== undefined) {
-                        logFlushDelay = handler.logFlushDelay;
-                        break;
-                    }
-                }
-                // Use setTimeout safely - handle test environment
-                let timeoutFn: typeof setTimeout;
-                if (typeof setTimeout !== 'undefined') {
-                    timeoutFn = setTimeout;
-                } else if (typeof global !== 'undefined' && global.setTimeout) {
-                    timeoutFn = global.setTimeout;
-                } else if (typeof window !== 'undefined' && window.setTimeout) {
-                    timeoutFn = window.setTimeout;
-                } else {
-                    // Fallback for test environment - create a simple mock
-                    timeoutFn = ((fn: () => void, ms: number) => {
-                        return setTimeout(fn, ms);
-                    }) as typeof setTimeout;
-                }
-                
-                const timeoutId = timeoutFn(() => {
-                    const bufferToFlush = logBuffers.get(containerId) || '';
-                    if (bufferToFlush.length > 0) {
-                        logBuffers.set(containerId, ''); // Clear buffer for this container
-                        logger.debug('Flushing log buffer:', {
-                            containerId,
-                            bufferLength: bufferToFlush.length,
-                            lineCount: (bufferToFlush.match(/\n/g) || []).length + 1
-                        });
-                        globalHandlers.forEach(handler => {
-                            if (handler.onLogUpdate) {
-                                try {
-                                    handler.onLogUpdate(containerId, bufferToFlush);
-                                } catch (error: any) {
-                                    logger.error('Error in log update handler:', error instanceof Error ? error : new Error(String(error)));
-                                }
-                            }
-                        });
-                    }
-                    // Clean up after timeout completion
-                    pendingFlushes.delete(containerId);
-                    activeTimeouts.delete(containerId);
-                }, logFlushDelay);
-                activeTimeouts.set(containerId, timeoutId); // Store the timeout ID
-            }
+            bufferLogUpdate(data.container_id, data.logs.join(''));
         });
 
         globalSocket.connect();